@@ -3,11 +3,13 @@ from pathlib import Path
 import time
 
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from job_search.config import settings
 from job_search.database import init_db
+from job_search.utils.background import cancel_background_tasks
 from job_search.utils.logging_config import setup_logging
 
 # Initialize Logging
@@ -22,7 +24,12 @@ async def lifespan(app: FastAPI):
     Path("job_search/static/uploads").mkdir(parents=True, exist_ok=True)
     Path("job_search/static/generated").mkdir(parents=True, exist_ok=True)
     init_db()
+    from job_search.routes.api_search import mark_interrupted_searches
+
+    mark_interrupted_searches()
     yield
+    # Shutdown: stop in-flight background work so it can release DB sessions and browsers.
+    await cancel_background_tasks()
 
 
 def create_app() -> FastAPI:
@@ -30,6 +37,7 @@ def create_app() -> FastAPI:
         title=settings.app_name,
         debug=settings.debug,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Static files
@@ -68,9 +76,13 @@ def create_app() -> FastAPI:
             response.headers["Expires"] = "0"
             return response
 
-        # Keep dynamic pages and API responses fresh.
+        # Keep dynamic pages and API responses fresh. Responses carrying an ETag may be
+        # stored so pollers can revalidate and receive 304s, but are never reused unchecked.
         if path.startswith("/api/") or not path.startswith("/static/"):
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
+            if "etag" in response.headers:
+                response.headers["Cache-Control"] = "no-cache, must-revalidate, max-age=0"
+            else:
+                response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
             response.headers["Pragma"] = "no-cache"
             response.headers["Expires"] = "0"
             return response
@@ -11,6 +11,12 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///data/job_search.db"
+    # Connection pool sizing for server databases (ignored for SQLite).
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    # Recycle before the 30-60 min idle timeouts common on managed Postgres and proxies.
+    db_pool_recycle_seconds: int = 1800
+    db_pool_timeout_seconds: int = 30
 
     # LLM
     llm_provider: str = "ollama"  # "claude", "openai", or "ollama"
@@ -27,6 +33,8 @@ class Settings(BaseSettings):
     browser_headless: bool = False
     scrape_delay_min: float = 2.0
     scrape_delay_max: float = 7.0
+    # Search runs scraping at once in this process; later runs wait in the "queued" state.
+    max_concurrent_searches: int = 2
     apply_delay_min: float = 30.0
     apply_delay_max: float = 90.0
     external_challenge_assist: bool = True
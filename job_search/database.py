@@ -1,4 +1,11 @@
-from sqlalchemy import create_engine, text
+import json
+from typing import Any
+
+import orjson
+
+from sqlalchemy import JSON, case, cast, create_engine, func, literal, make_url, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 # Engine and session are created lazily so that tests can override DATABASE_URL
@@ -23,6 +30,19 @@ def reset_engine():
     _SessionLocal = None
 
 
+def _json_dumps(value: Any) -> str:
+    # Drivers expect text; non-string dict keys are stringified as the stdlib encoder does.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _json_loads(value: str | bytes) -> Any:
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        # Rows written by the stdlib encoder may hold NaN/Infinity, which orjson rejects.
+        return json.loads(value)
+
+
 def _get_engine():
     global _engine
     if _engine is None:
@@ -32,11 +52,25 @@ def _get_engine():
         # via os.environ before the engine is first created, even when the
         # Settings singleton was already instantiated with the default value.
         url = os.environ.get("DATABASE_URL") or settings.database_url
-        _engine = create_engine(
-            url,
-            connect_args={"check_same_thread": False} if url.startswith("sqlite") else {},
-            echo=settings.debug,
-        )
+        # JSON columns (match details, answers, learning data) are encoded with orjson.
+        json_kwargs = {"json_serializer": _json_dumps, "json_deserializer": _json_loads}
+        if url.startswith("sqlite"):
+            engine_kwargs = {"connect_args": {"check_same_thread": False}}
+        else:
+            # Size the pool for concurrent request threads plus background automation
+            # sessions, and drop connections the server may have closed while idle.
+            engine_kwargs = {
+                "pool_size": settings.db_pool_size,
+                "max_overflow": settings.db_max_overflow,
+                "pool_pre_ping": True,
+                "pool_recycle": settings.db_pool_recycle_seconds,
+                "pool_timeout": settings.db_pool_timeout_seconds,
+            }
+            if make_url(url).get_driver_name() == "psycopg2":
+                # INSERTs already batch via insertmanyvalues; this also routes executemany
+                # UPDATEs (e.g. rescoring) through psycopg2's execute_batch.
+                engine_kwargs["executemany_mode"] = "values_plus_batch"
+        _engine = create_engine(url, echo=settings.debug, **json_kwargs, **engine_kwargs)
     return _engine
 
 
@@ -75,6 +109,34 @@ class Base(DeclarativeBase):
     pass
 
 
+def upsert_insert(entity, dialect_name: str):
+    """
+    Dialect-specific INSERT construct exposing on_conflict_do_nothing/do_update.
+    Both supported backends (SQLite, PostgreSQL) accept the same ON CONFLICT syntax.
+    """
+    if dialect_name == "postgresql":
+        return postgresql.insert(entity)
+    return sqlite.insert(entity)
+
+
+def json_merge(column, patch: dict[str, Any], dialect_name: str):
+    """
+    SQL expression that shallow-merges ``patch`` into a JSON column server-side,
+    so bulk UPDATEs can set flags inside JSON blobs without hydrating rows.
+    SQL NULL and JSON ``null`` are both treated as an empty object.
+    """
+    if dialect_name == "postgresql":
+        as_jsonb = cast(column, JSONB)
+        base = case((func.jsonb_typeof(as_jsonb) == "object", as_jsonb), else_=cast(literal("{}"), JSONB))
+        return cast(base.op("||")(cast(literal(_json_dumps(patch)), JSONB)), JSON)
+
+    args: list[Any] = [case((func.json_type(column) == "object", column), else_=literal("{}"))]
+    for key, value in patch.items():
+        args.append(literal(f'$."{key}"'))
+        args.append(func.json(literal(_json_dumps(value))))
+    return func.json_set(*args)
+
+
 def get_db():
     """FastAPI dependency that yields a database session."""
     db = _get_session_factory()()
@@ -89,6 +151,48 @@ def init_db():
     import job_search.models  # noqa: F401 — ensure models are registered
     Base.metadata.create_all(bind=_get_engine())
     _run_lightweight_migrations()
+    _drop_retired_indexes()
+    _ensure_indexes()
+    _seed_singleton_profile()
+
+
+def _seed_singleton_profile():
+    """
+    Insert the blank single-user profile once, so request handlers never race to
+    create it. Databases that already hold a profile are left untouched.
+    """
+    from job_search.models.user_profile import SINGLETON_PROFILE_ID, UserProfile
+
+    eng = _get_engine()
+    with eng.begin() as conn:
+        if conn.execute(select(UserProfile.id).limit(1)).first() is not None:
+            return
+        conn.execute(
+            upsert_insert(UserProfile, eng.dialect.name)
+            .values(id=SINGLETON_PROFILE_ID, full_name="", email="")
+            .on_conflict_do_nothing()
+        )
+
+
+# Indexes earlier versions created that no query uses any more; they only cost writes.
+_RETIRED_INDEXES = ("ix_applications_active",)
+
+
+def _drop_retired_indexes():
+    with _get_engine().begin() as conn:
+        for name in _RETIRED_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+def _ensure_indexes():
+    """
+    Create indexes declared on models that are missing from an existing database.
+    create_all() only emits indexes together with brand-new tables.
+    """
+    eng = _get_engine()
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=eng, checkfirst=True)
 
 
 def _run_lightweight_migrations():
@@ -106,6 +210,7 @@ def _run_lightweight_migrations():
         "work_authorization": "TEXT",
         "requires_sponsorship": "INTEGER",
         "application_answers": "JSON",
+        "learning_summary_cache": "JSON",
         "technical_manifesto": "TEXT",
         "preferred_team_style": "TEXT",
         "execution_preference": "TEXT",
@@ -119,6 +224,15 @@ def _run_lightweight_migrations():
         "user_inputs": "JSON",
     }
 
+    resume_columns = {
+        "content_hash": "VARCHAR(64)",
+    }
+
+    search_query_columns = {
+        "run_id": "VARCHAR(36)",
+        "run_state": "VARCHAR(20)",
+    }
+
     with eng.begin() as conn:
         rows = conn.execute(text("PRAGMA table_info(user_profiles)")).fetchall()
         existing = {row[1] for row in rows}
@@ -137,3 +251,21 @@ def _run_lightweight_migrations():
             conn.execute(
                 text(f"ALTER TABLE applications ADD COLUMN {column} {col_type}")
             )
+
+        resume_rows = conn.execute(text("PRAGMA table_info(resumes)")).fetchall()
+        resume_existing = {row[1] for row in resume_rows}
+        for column, col_type in resume_columns.items():
+            if column in resume_existing:
+                continue
+            conn.execute(
+                text(f"ALTER TABLE resumes ADD COLUMN {column} {col_type}")
+            )
+
+        search_rows = conn.execute(text("PRAGMA table_info(search_queries)")).fetchall()
+        search_existing = {row[1] for row in search_rows}
+        for column, col_type in search_query_columns.items():
+            if column in search_existing:
+                continue
+            conn.execute(
+                text(f"ALTER TABLE search_queries ADD COLUMN {column} {col_type}")
+            )
@@ -1,6 +1,7 @@
 import enum
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum as SAEnum, JSON
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -31,8 +32,9 @@ class Application(Base):
     notes = Column(Text, nullable=True)
     error_message = Column(Text, nullable=True)
     automation_log = Column(Text, nullable=True)
-    blocker_details = Column(JSON, nullable=True)
-    user_inputs = Column(JSON, nullable=True)
+    # MutableDict tracks in-place key writes, so callers need not copy-and-reassign the dict.
+    blocker_details = Column(MutableDict.as_mutable(JSON), nullable=True)
+    user_inputs = Column(MutableDict.as_mutable(JSON), nullable=True)
     created_at = Column(DateTime, server_default=func.now())
 
     job = relationship("Job")
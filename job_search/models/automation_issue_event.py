@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey, Index
 from sqlalchemy.sql import func
 
 from job_search.database import Base
@@ -19,3 +19,13 @@ class AutomationIssueEvent(Base):
     suggested_questions = Column(JSON, nullable=True)
     created_at = Column(DateTime, server_default=func.now(), index=True)
 
+    __table_args__ = (
+        # Serves the "latest detected issue for an application" lookup on the blockers endpoint.
+        Index(
+            "ix_automation_issue_events_app_detected",
+            "application_id",
+            id.desc(),
+            sqlite_where=event_type == "detected",
+            postgresql_where=event_type == "detected",
+        ),
+    )
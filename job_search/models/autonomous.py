@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -28,6 +28,16 @@ class AutonomousRun(Base):
     resume = relationship("Resume")
     logs = relationship("AutonomousJobLog", back_populates="run")
 
+    __table_args__ = (
+        # Backs the "is a run already queued/running?" lookup without scanning past runs.
+        Index(
+            "ix_autonomous_runs_active",
+            id.desc(),
+            sqlite_where=status.in_(["queued", "running"]),
+            postgresql_where=status.in_(["queued", "running"]),
+        ),
+    )
+
 
 class AutonomousJobLog(Base):
     __tablename__ = "autonomous_job_logs"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, JSON, Boolean, Index
 from sqlalchemy.sql import func
 
 from job_search.database import Base
@@ -37,3 +37,34 @@ class Job(Base):
     # Status
     is_archived = Column(Boolean, default=False)
     search_query_id = Column(Integer, nullable=True)
+
+    __table_args__ = (
+        # Back the default listings (active jobs by score / by posting date) and their
+        # keyset cursors, matching ORDER BY <col> DESC NULLS LAST, id DESC. SQLite rejects
+        # NULLS LAST in index definitions but already sorts NULLs lowest, so plain DESC
+        # gives it the same order.
+        Index(
+            "ix_jobs_active_score",
+            match_score.desc().nullslast(),
+            id.desc(),
+            postgresql_where=is_archived == False,  # noqa: E712
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_jobs_active_score",
+            match_score.desc(),
+            id.desc(),
+            sqlite_where=is_archived == False,  # noqa: E712
+        ).ddl_if(dialect="sqlite"),
+        Index(
+            "ix_jobs_active_posted",
+            posted_date.desc().nullslast(),
+            id.desc(),
+            postgresql_where=is_archived == False,  # noqa: E712
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_jobs_active_posted",
+            posted_date.desc(),
+            id.desc(),
+            sqlite_where=is_archived == False,  # noqa: E712
+        ).ddl_if(dialect="sqlite"),
+    )
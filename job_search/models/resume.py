@@ -14,6 +14,7 @@ class Resume(Base):
     file_type = Column(String(10), nullable=False)
     parsed_data = Column(JSON, nullable=True)
     raw_text = Column(Text, nullable=True)
+    content_hash = Column(String(64), nullable=True, unique=True, index=True)  # SHA-256 of the uploaded file
     is_primary = Column(Boolean, default=False)
     created_at = Column(DateTime, server_default=func.now())
 
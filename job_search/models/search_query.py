@@ -20,4 +20,7 @@ class SearchQuery(Base):
     is_active = Column(Boolean, default=True)
     last_run_at = Column(DateTime, nullable=True)
     results_count = Column(Integer, default=0)
+    # Set for ad-hoc runs from POST /api/search/run so their status survives a restart.
+    run_id = Column(String(36), nullable=True, unique=True, index=True)
+    run_state = Column(String(20), nullable=True)  # queued | running | completed | cancelled | failed | interrupted
     created_at = Column(DateTime, server_default=func.now())
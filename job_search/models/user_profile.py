@@ -1,8 +1,12 @@
 from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean, Float
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.sql import func
 
 from job_search.database import Base
 
+# The app is single-user: init_db() seeds this row so handlers can fetch it by primary key.
+SINGLETON_PROFILE_ID = 1
+
 
 class UserProfile(Base):
     __tablename__ = "user_profiles"
@@ -36,6 +40,9 @@ class UserProfile(Base):
     requires_sponsorship = Column(Boolean, nullable=True)
     linkedin_email = Column(String(200), nullable=True)
     linkedin_password_encrypted = Column(Text, nullable=True)
-    application_answers = Column(JSON, nullable=True)
+    # MutableDict tracks top-level key writes such as answers["__learning"] = ... in place.
+    application_answers = Column(MutableDict.as_mutable(JSON), nullable=True)
+    # Rendered automation-learning summary, refreshed whenever "__learning" is updated.
+    learning_summary_cache = Column(JSON, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
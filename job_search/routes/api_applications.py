@@ -1,16 +1,20 @@
 from __future__ import annotations
 from datetime import datetime
+from functools import lru_cache
 import os
-import urllib.parse
-from typing import Any, Optional
+import re
+import threading
+import time
+from typing import Any, Callable, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
-from sqlalchemy.orm import Session
-from sqlalchemy import func as sa_func
+from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Response
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import func as sa_func, select, update
 
 from job_search.config import settings
-from job_search.database import get_db
+from job_search.database import get_db, json_merge, upsert_insert
 from job_search.models import Application, ApplicationStatus, Job, UserProfile, Resume, AutomationIssueEvent
+from job_search.routes.api_profile import invalidate_profile_cache
 from job_search.schemas.application import (
     ApplicationCreate,
     ApplicationUpdate,
@@ -20,9 +24,56 @@ from job_search.schemas.application import (
     BatchApplyRequest,
     BlockerAnswerRequest,
 )
+from job_search.services.applier import JobApplier
+from job_search.utils.pagination import after_desc_nulls_last, decode_cursor, encode_cursor
 
 router = APIRouter()
 
+_HOSTNAME_RE = re.compile(r"^[a-z][a-z0-9+.-]*://(?:[^@/?#]*@)?([^:/?#]+)", re.IGNORECASE)
+
+# Dashboard stats are polled frequently; status changes made by background automation
+# are picked up when the short TTL lapses, route-level writes invalidate immediately.
+_STATS_CACHE: dict[str, tuple[float, Any]] = {}
+_STATS_TTL_SECONDS = 15
+_STATS_LOCK = threading.Lock()
+_STATS_STATUSES = frozenset(("queued", "submitted", "interview", "rejected", "offer", "failed"))
+
+
+def invalidate_stats_cache() -> None:
+    _STATS_CACHE.clear()
+
+
+def cached_stats(key: str, compute: Callable[[], Any]) -> Any:
+    """
+    Serve an aggregate from the stats cache for up to _STATS_TTL_SECONDS, computing it at
+    most once at a time. invalidate_stats_cache() drops every key.
+    """
+    cached = _STATS_CACHE.get(key)
+    if cached and time.time() - cached[0] < _STATS_TTL_SECONDS:
+        return cached[1]
+    # Single-flight: concurrent pollers wait for one computation instead of all hitting the DB.
+    with _STATS_LOCK:
+        cached = _STATS_CACHE.get(key)
+        if cached and time.time() - cached[0] < _STATS_TTL_SECONDS:
+            return cached[1]
+        value = compute()
+        _STATS_CACHE[key] = (time.time(), value)
+    return value
+
+
+@lru_cache(maxsize=1)
+def _get_applier() -> JobApplier:
+    return JobApplier()
+
+
+def applier_dep() -> JobApplier:
+    """FastAPI dependency returning the process-wide JobApplier (it holds no per-run state)."""
+    return _get_applier()
+
+
+def _latest_profile(db: Session) -> Optional[UserProfile]:
+    return db.scalar(select(UserProfile).order_by(UserProfile.id.desc()).limit(1))
+
 
 def _sanitize_answer_value(value: Any) -> Any:
     if isinstance(value, str):
@@ -71,11 +122,15 @@ def _answer_map(profile: Optional[UserProfile], application: Application) -> dic
     return merged
 
 
-def _is_missing_required(item: dict[str, Any], merged_answers: dict[str, Any]) -> bool:
-    key = str(item.get("key", "")).strip().lower()
-    if not key:
+def _normalize_required(items: list[dict[str, Any]]) -> list[tuple[str, dict[str, Any]]]:
+    """Pair each required-input item with its normalized answer key, computed once."""
+    return [(str(item.get("key", "")).strip().lower(), item) for item in items]
+
+
+def _missing_from_normalized(norm_key: str, merged_answers: dict[str, Any]) -> bool:
+    if not norm_key:
         return True
-    value = merged_answers.get(key)
+    value = merged_answers.get(norm_key)
     if value is None:
         return True
     if isinstance(value, str) and not value.strip():
@@ -83,65 +138,109 @@ def _is_missing_required(item: dict[str, Any], merged_answers: dict[str, Any]) -
     return False
 
 
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except Exception:
+        return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(float(value))
+    except Exception:
+        return None
+
+
+def _to_bool(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    lv = value.strip().lower()
+    if lv in {"yes", "true", "1"}:
+        return True
+    if lv in {"no", "false", "0"}:
+        return False
+    return None
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+# Answer key -> (UserProfile attribute, converter). A converter returning None skips the field.
+# Applied in this order, so a later key wins when two map to the same attribute
+# (official_email takes priority over email).
+_FIELD_HANDLERS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "full_name": ("full_name", _passthrough),
+    "email": ("email", _passthrough),
+    "official_email": ("email", _passthrough),
+    "phone": ("phone", _passthrough),
+    "location": ("location", _passthrough),
+    "linkedin_url": ("linkedin_url", _passthrough),
+    "expected_ctc_lpa": ("expected_ctc_lpa", _to_float),
+    "current_ctc_lpa": ("current_ctc_lpa", _to_float),
+    "notice_period_days": ("notice_period_days", _to_int),
+    "can_join_immediately": ("can_join_immediately", _to_bool),
+    "willing_to_relocate": ("willing_to_relocate", _to_bool),
+    "requires_sponsorship": ("requires_sponsorship", _to_bool),
+    "work_authorization": ("work_authorization", _passthrough),
+}
+
+
 def _sync_profile_from_answers(profile: UserProfile, answers: dict[str, Any]) -> None:
-    field_map = {
-        "full_name": "full_name",
-        "email": "email",
-        "official_email": "email",
-        "phone": "phone",
-        "location": "location",
-        "linkedin_url": "linkedin_url",
-        "expected_ctc_lpa": "expected_ctc_lpa",
-        "current_ctc_lpa": "current_ctc_lpa",
-        "notice_period_days": "notice_period_days",
-        "can_join_immediately": "can_join_immediately",
-        "willing_to_relocate": "willing_to_relocate",
-        "requires_sponsorship": "requires_sponsorship",
-        "work_authorization": "work_authorization",
-    }
-    for key, profile_field in field_map.items():
+    for key, (profile_field, convert) in _FIELD_HANDLERS.items():
         if key not in answers:
             continue
         value = _sanitize_answer_value(answers[key])
         if value is None:
             continue
-        if profile_field in {"expected_ctc_lpa", "current_ctc_lpa"}:
-            try:
-                value = float(value)
-            except Exception:
-                continue
-        elif profile_field in {"notice_period_days"}:
-            try:
-                value = int(float(value))
-            except Exception:
-                continue
-        elif profile_field in {"can_join_immediately", "willing_to_relocate", "requires_sponsorship"}:
-            if isinstance(value, str):
-                lv = value.strip().lower()
-                if lv in {"yes", "true", "1"}:
-                    value = True
-                elif lv in {"no", "false", "0"}:
-                    value = False
-                else:
-                    continue
+        value = convert(value)
+        if value is None:
+            continue
         setattr(profile, profile_field, value)
 
 
 @router.get("", response_model=list[ApplicationResponse])
 def list_applications(
+    response: Response,
     status: Optional[str] = None,
     job_id: Optional[int] = None,
     page: int = Query(1, ge=1),
     per_page: int = Query(25, ge=1, le=100),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     db: Session = Depends(get_db),
 ):
-    query = db.query(Application)
+    query = db.query(Application).options(raiseload("*"))
     if status:
         query = query.filter(Application.status == status)
     if job_id:
         query = query.filter(Application.job_id == job_id)
-    query = query.order_by(Application.created_at.desc())
-    return query.offset((page - 1) * per_page).limit(per_page).all()
+    if include_total:
+        response.headers["X-Total-Count"] = str(query.count())
+    query = query.order_by(Application.created_at.desc().nullslast(), Application.id.desc())
+    if cursor:
+        try:
+            cursor_sort, cursor_value, cursor_id = decode_cursor(cursor)
+            if cursor_value is not None:
+                cursor_value = datetime.fromisoformat(cursor_value)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if cursor_sort != "created_at":
+            raise HTTPException(status_code=400, detail="Cursor does not match sort order")
+        query = query.filter(
+            after_desc_nulls_last(Application.created_at, cursor_value, Application.id, cursor_id)
+        )
+        apps = query.limit(per_page + 1).all()
+    else:
+        apps = query.offset((page - 1) * per_page).limit(per_page + 1).all()
+    has_more = len(apps) > per_page
+    apps = apps[:per_page]
+    response.headers["X-Has-More"] = "1" if has_more else "0"
+    if has_more:
+        last = apps[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor("created_at", last.created_at, last.id)
+    return apps
 
 
 @router.get("/issues")
@@ -152,55 +251,60 @@ def list_automation_issues(
     db: Session = Depends(get_db),
 ):
     """Return recent automation issue events (detected/resolved) for learning/debugging."""
-    q = db.query(AutomationIssueEvent).order_by(AutomationIssueEvent.id.desc())
+    stmt = select(
+        AutomationIssueEvent.id,
+        AutomationIssueEvent.application_id,
+        AutomationIssueEvent.job_id,
+        AutomationIssueEvent.source,
+        AutomationIssueEvent.domain,
+        AutomationIssueEvent.category,
+        AutomationIssueEvent.event_type,
+        AutomationIssueEvent.message,
+        AutomationIssueEvent.required_user_inputs,
+        AutomationIssueEvent.suggested_questions,
+        AutomationIssueEvent.created_at,
+    ).order_by(AutomationIssueEvent.id.desc())
     if category:
-        q = q.filter(AutomationIssueEvent.category == category)
+        stmt = stmt.where(AutomationIssueEvent.category == category)
     if event_type:
-        q = q.filter(AutomationIssueEvent.event_type == event_type)
+        stmt = stmt.where(AutomationIssueEvent.event_type == event_type)
 
-    rows = q.limit(limit).all()
     return [
         {
-            "id": row.id,
-            "application_id": row.application_id,
-            "job_id": row.job_id,
-            "source": row.source,
-            "domain": row.domain,
-            "category": row.category,
-            "event_type": row.event_type,
-            "message": row.message,
-            "required_user_inputs": row.required_user_inputs or [],
-            "suggested_questions": row.suggested_questions or [],
-            "created_at": row.created_at.isoformat() if row.created_at else None,
+            **row,
+            "required_user_inputs": row["required_user_inputs"] or [],
+            "suggested_questions": row["suggested_questions"] or [],
         }
-        for row in rows
+        for row in db.execute(stmt.limit(limit)).mappings()
     ]
 
 
 @router.post("", response_model=ApplicationResponse)
 def create_application(request: ApplicationCreate, db: Session = Depends(get_db)):
     """Create a new application for a job."""
-    job = db.query(Job).filter(Job.id == request.job_id).first()
+    job = db.get(Job, request.job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    existing = db.query(Application).filter(Application.job_id == request.job_id).first()
-    if existing:
-        raise HTTPException(status_code=409, detail="Application already exists for this job")
-
-    application = Application(
-        job_id=request.job_id,
-        status=ApplicationStatus.QUEUED,
+    # Single atomic statement: the unique job_id constraint decides whether we created a row.
+    stmt = (
+        upsert_insert(Application, db.get_bind().dialect.name)
+        .values(job_id=request.job_id, status=ApplicationStatus.QUEUED)
+        .on_conflict_do_nothing(index_elements=["job_id"])
+        .returning(Application)
     )
-    db.add(application)
+    application = db.execute(stmt).scalar_one_or_none()
+    if application is None:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Application already exists for this job")
     db.commit()
-    db.refresh(application)
+    invalidate_stats_cache()
     return application
 
 
 @router.patch("/{app_id}", response_model=ApplicationResponse)
 def update_application(app_id: int, request: ApplicationUpdate, db: Session = Depends(get_db)):
-    application = db.query(Application).filter(Application.id == app_id).first()
+    application = db.get(Application, app_id)
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
 
@@ -213,6 +317,7 @@ def update_application(app_id: int, request: ApplicationUpdate, db: Session = De
         application.notes = request.notes
 
     db.commit()
+    invalidate_stats_cache()
     db.refresh(application)
     return application
 
@@ -222,19 +327,20 @@ def update_application(app_id: int, request: ApplicationUpdate, db: Session = De
 # ------------------------------------------------------------------
 
 @router.get("/{app_id}/preview")
-def preview_application(app_id: int, db: Session = Depends(get_db)):
+def preview_application(
+    app_id: int,
+    db: Session = Depends(get_db),
+    applier: JobApplier = Depends(applier_dep),
+):
     """Return everything the user needs to see before confirming an application."""
-    from job_search.services.applier import JobApplier
-
-    app = db.query(Application).filter(Application.id == app_id).first()
+    app = db.get(Application, app_id)
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    job = db.query(Job).filter(Job.id == app.job_id).first()
-    profile = db.query(UserProfile).order_by(UserProfile.id.desc()).first()
+    job = db.get(Job, app.job_id)
+    profile = _latest_profile(db)
     resumes = db.query(Resume).order_by(Resume.is_primary.desc()).all()
     primary_resume = resumes[0] if resumes else None
-    applier = JobApplier()
     if profile or primary_resume:
         profile = applier._hydrate_profile_from_resume_if_needed(profile, primary_resume, db)
     if job and profile:
@@ -291,25 +397,28 @@ def preview_application(app_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/{app_id}/preflight")
-async def preflight_application(app_id: int, resume_id: Optional[int] = None, db: Session = Depends(get_db)):
+async def preflight_application(
+    app_id: int,
+    resume_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    applier: JobApplier = Depends(applier_dep),
+):
     """Validate whether an application can be auto-filled safely."""
-    from job_search.services.applier import JobApplier
     from job_search.services.apply_url_resolver import resolve_official_apply_url
 
-    app = db.query(Application).filter(Application.id == app_id).first()
+    app = db.get(Application, app_id)
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    job = db.query(Job).filter(Job.id == app.job_id).first()
-    profile = db.query(UserProfile).order_by(UserProfile.id.desc()).first()
+    job = db.get(Job, app.job_id)
+    profile = _latest_profile(db)
 
     selected_resume = None
     if resume_id:
-        selected_resume = db.query(Resume).filter(Resume.id == resume_id).first()
+        selected_resume = db.get(Resume, resume_id)
     if not selected_resume:
         selected_resume = db.query(Resume).filter(Resume.is_primary == True).first()
 
-    applier = JobApplier()
     source_mode = applier.source_mode(job) if job else "manual"
     supported_sources = {"linkedin", "greenhouse", "lever", "generic"}
     source_supported = source_mode in supported_sources
@@ -381,24 +490,24 @@ async def preflight_application(app_id: int, resume_id: Optional[int] = None, db
 
 @router.get("/{app_id}/blockers")
 def get_application_blockers(app_id: int, db: Session = Depends(get_db)):
-    app = db.query(Application).filter(Application.id == app_id).first()
+    app = db.get(Application, app_id)
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    profile = db.query(UserProfile).order_by(UserProfile.id.desc()).first()
+    profile = _latest_profile(db)
     blocker_details = app.blocker_details if isinstance(app.blocker_details, dict) else {}
     required_inputs = blocker_details.get("required_inputs") if isinstance(blocker_details, dict) else None
 
     if not required_inputs:
-        latest_issue = (
-            db.query(AutomationIssueEvent)
-            .filter(
+        latest_issue = db.execute(
+            select(AutomationIssueEvent.required_user_inputs, AutomationIssueEvent.suggested_questions)
+            .where(
                 AutomationIssueEvent.application_id == app.id,
                 AutomationIssueEvent.event_type == "detected",
             )
             .order_by(AutomationIssueEvent.id.desc())
-            .first()
-        )
+            .limit(1)
+        ).first()
         issue_inputs = []
         if latest_issue and isinstance(latest_issue.required_user_inputs, list):
             for idx, key in enumerate(latest_issue.required_user_inputs):
@@ -421,7 +530,9 @@ def get_application_blockers(app_id: int, db: Session = Depends(get_db)):
     normalized_required = [ri for ri in required_inputs if isinstance(ri, dict)]
 
     merged_answers = _answer_map(profile, app)
-    unresolved = [item for item in normalized_required if _is_missing_required(item, merged_answers)]
+    unresolved = [
+        item for key, item in _normalize_required(normalized_required) if _missing_from_normalized(key, merged_answers)
+    ]
     known_answers = {k: v for k, v in merged_answers.items() if v not in (None, "")}
 
     return {
@@ -443,15 +554,14 @@ async def save_blocker_answers(
     request: BlockerAnswerRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
+    applier: JobApplier = Depends(applier_dep),
 ):
-    from job_search.services.applier import JobApplier
-
-    app = db.query(Application).filter(Application.id == app_id).first()
+    app = db.get(Application, app_id)
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
-    job = db.query(Job).filter(Job.id == app.job_id).first()
+    job = db.get(Job, app.job_id)
 
-    profile = db.query(UserProfile).order_by(UserProfile.id.desc()).first()
+    profile = _latest_profile(db)
     if not profile:
         profile = UserProfile(full_name="", email="")
         db.add(profile)
@@ -494,17 +604,16 @@ async def save_blocker_answers(
     required_inputs = [ri for ri in required_inputs if isinstance(ri, dict)]
 
     merged_answers = _answer_map(profile, app)
-    unresolved = [item for item in required_inputs if _is_missing_required(item, merged_answers)]
+    unresolved = [
+        item for key, item in _normalize_required(required_inputs) if _missing_from_normalized(key, merged_answers)
+    ]
 
     blocker_details["last_answer_update_at"] = datetime.utcnow().isoformat()
     blocker_details["pending_required_inputs"] = unresolved
     app.blocker_details = blocker_details
 
-    domain = None
-    try:
-        domain = (urllib.parse.urlparse((job.apply_url or job.url or "") if job else "").hostname or "").lower() or None
-    except Exception:
-        domain = None
+    match = _HOSTNAME_RE.match((job.apply_url or job.url or "") if job else "")
+    domain = match.group(1).lower() if match else None
     if sanitized_answers:
         db.add(
             AutomationIssueEvent(
@@ -522,9 +631,9 @@ async def save_blocker_answers(
 
     app.error_message = None
     db.commit()
+    invalidate_profile_cache()
 
     retried_application_ids: list[int] = []
-    applier = JobApplier()
     if request.retry_now and len(unresolved) == 0:
         background_tasks.add_task(
             applier.run_automation,
@@ -549,11 +658,10 @@ async def save_blocker_answers(
             reqs = details.get("required_inputs") if isinstance(details, dict) else []
             if not isinstance(reqs, list):
                 reqs = []
-            reqs = [ri for ri in reqs if isinstance(ri, dict)]
+            normalized = _normalize_required([ri for ri in reqs if isinstance(ri, dict)])
 
             merged_for_blocked = _answer_map(profile, blocked)
-            unresolved_blocked = [ri for ri in reqs if _is_missing_required(ri, merged_for_blocked)]
-            if unresolved_blocked:
+            if any(_missing_from_normalized(key, merged_for_blocked) for key, _ in normalized):
                 continue
 
             background_tasks.add_task(
@@ -579,18 +687,20 @@ async def save_blocker_answers(
 
 @router.get("/stats", response_model=ApplicationStatsResponse)
 def get_stats(db: Session = Depends(get_db)):
-    total = db.query(Application).count()
-    counts = (
-        db.query(Application.status, sa_func.count())
-        .group_by(Application.status)
-        .all()
-    )
-    stats = {"total": total}
-    for status, count in counts:
-        status_val = status.value if hasattr(status, "value") else status
-        if status_val in ("queued", "submitted", "interview", "rejected", "offer", "failed"):
-            stats[status_val] = count
-    return ApplicationStatsResponse(**stats)
+    def compute() -> dict:
+        counts = (
+            db.query(Application.status, sa_func.count())
+            .group_by(Application.status)
+            .all()
+        )
+        stats = {"total": sum(count for _, count in counts)}
+        for status, count in counts:
+            status_val = getattr(status, "value", status)
+            if status_val in _STATS_STATUSES:
+                stats[status_val] = count
+        return stats
+
+    return ApplicationStatsResponse(**cached_stats("stats", compute))
 
 
 # ------------------------------------------------------------------
@@ -602,49 +712,56 @@ def batch_apply(
     request: BatchApplyRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
+    applier: JobApplier = Depends(applier_dep),
 ):
     """Queue selected jobs for application, gated by a score threshold."""
-    from job_search.services.applier import JobApplier
-
     created = []
     skipped = []
     automated = []
     min_score = request.min_score if request.min_score is not None else float(settings.auto_apply_min_score)
 
+    existing = set(
+        db.scalars(select(Application.job_id).where(Application.job_id.in_(request.job_ids)))
+    )
+    scores = dict(db.execute(select(Job.id, Job.match_score).where(Job.id.in_(request.job_ids))).all())
+
+    to_create: list[int] = []
     for job_id in request.job_ids:
-        existing = db.query(Application).filter(Application.job_id == job_id).first()
-        if existing:
+        if job_id in existing or job_id not in scores:
             skipped.append(job_id)
             continue
-        job = db.query(Job).filter(Job.id == job_id).first()
-        if not job:
+        score = scores[job_id]
+        if score is not None and float(score) < min_score:
             skipped.append(job_id)
             continue
-        if job.match_score is not None and float(job.match_score) < min_score:
-            skipped.append(job_id)
-            continue
-        app = Application(job_id=job_id, status=ApplicationStatus.QUEUED)
-        db.add(app)
-        created.append(job_id)
-
+        existing.add(job_id)
+        to_create.append(job_id)
+
+    created_rows = []
+    if to_create:
+        stmt = (
+            upsert_insert(Application, db.get_bind().dialect.name)
+            .values([{"job_id": job_id, "status": ApplicationStatus.QUEUED} for job_id in to_create])
+            .on_conflict_do_nothing(index_elements=["job_id"])
+            .returning(Application.id, Application.job_id)
+        )
+        created_rows = db.execute(stmt).all()
     db.commit()
+    invalidate_stats_cache()
+    created_ids = {row.job_id for row in created_rows}
+    created = [job_id for job_id in to_create if job_id in created_ids]
+    skipped.extend(job_id for job_id in to_create if job_id not in created_ids)
 
-    if request.auto_automate and created:
-        applier = JobApplier()
-        created_apps = (
-            db.query(Application)
-            .filter(Application.job_id.in_(created))
-            .all()
-        )
-        for app in created_apps:
+    if request.auto_automate:
+        for row in created_rows:
             background_tasks.add_task(
                 applier.run_automation,
-                app.id,
+                row.id,
                 request.resume_id,
                 request.safe_mode,
                 request.require_confirmation,
             )
-            automated.append(app.job_id)
+            automated.append(row.job_id)
 
     return {
         "created": len(created),
@@ -665,27 +782,24 @@ async def automate_application(
     background_tasks: BackgroundTasks,
     request: Optional[AutomateRequest] = None,
     db: Session = Depends(get_db),
+    applier: JobApplier = Depends(applier_dep),
 ):
     """Launch automated application with optional resume selection."""
-    from job_search.services.applier import JobApplier
-
-    app = db.query(Application).filter(Application.id == app_id).first()
+    app = db.get(Application, app_id)
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
 
     # Clear stale stop flags from a previous run before starting again.
-    user_inputs = dict(app.user_inputs or {})
-    if user_inputs.get("__stop_requested"):
+    user_inputs = app.user_inputs
+    if user_inputs and user_inputs.get("__stop_requested"):
         user_inputs["__stop_requested"] = False
         user_inputs["__stop_requested_at"] = None
         user_inputs["__stop_reason"] = None
-        app.user_inputs = user_inputs
         db.commit()
 
     resume_id = request.resume_id if request else None
     safe_mode = request.safe_mode if request else False
     require_confirmation = request.require_confirmation if request else False
-    applier = JobApplier()
     background_tasks.add_task(applier.run_automation, app_id, resume_id, safe_mode, require_confirmation)
     return {
         "message": "Automation started",
@@ -700,23 +814,32 @@ async def automate_application(
 def stop_active_automations(db: Session = Depends(get_db)):
     """Request graceful stop for all currently running automations."""
     now = datetime.now().isoformat()
-    running_apps = (
-        db.query(Application)
-        .filter(Application.status == ApplicationStatus.IN_PROGRESS)
-        .all()
+    # One UPDATE ... RETURNING instead of hydrating every running application.
+    stmt = (
+        update(Application)
+        .where(Application.status == ApplicationStatus.IN_PROGRESS)
+        .values(
+            user_inputs=json_merge(
+                Application.user_inputs,
+                {
+                    "__stop_requested": True,
+                    "__stop_requested_at": now,
+                    "__stop_reason": "Stopped from Jobs UI",
+                },
+                db.get_bind().dialect.name,
+            ),
+            notes="Stop requested from UI.",
+            status=ApplicationStatus.REVIEWED,
+            error_message=None,
+            automation_log=sa_func.coalesce(Application.automation_log, "") + "Stop requested from Jobs UI.\n",
+        )
+        .returning(Application.id)
+        .execution_options(synchronize_session=False)
     )
-    for app in running_apps:
-        user_inputs = dict(app.user_inputs or {})
-        user_inputs["__stop_requested"] = True
-        user_inputs["__stop_requested_at"] = now
-        user_inputs["__stop_reason"] = "Stopped from Jobs UI"
-        app.user_inputs = user_inputs
-        app.notes = "Stop requested from UI."
-        app.status = ApplicationStatus.REVIEWED
-        app.error_message = None
-        app.automation_log = (app.automation_log or "") + "Stop requested from Jobs UI.\n"
+    stopped_ids = list(db.execute(stmt).scalars())
     db.commit()
+    invalidate_stats_cache()
     return {
-        "stopping_requested": len(running_apps),
-        "application_ids": [a.id for a in running_apps],
+        "stopping_requested": len(stopped_ids),
+        "application_ids": stopped_ids,
     }
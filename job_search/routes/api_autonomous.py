@@ -1,23 +1,27 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterator
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.orm import Session
 
 from job_search.config import settings
-from job_search.database import get_db
+from job_search.database import SessionLocal, get_db, json_merge
 from job_search.models import AutonomousRun, AutonomousJobLog, Resume, Job, Application, ApplicationStatus
+from job_search.routes.api_applications import invalidate_stats_cache
 from job_search.schemas.autonomous import (
     AutonomousRunRequest,
     AutonomousRunResponse,
     AutonomousRunStatusResponse,
     AutonomousStopResponse,
 )
-from job_search.services.workflow_agents import CoordinatorAgent
+from job_search.services.workflow_agents import autonomous_worker
 
 router = APIRouter()
 
@@ -116,7 +120,6 @@ def _heartbeat_event_from_log(run: AutonomousRun, log: AutonomousJobLog) -> dict
 @router.post("/runs", response_model=AutonomousRunResponse)
 async def start_autonomous_run(
     request: AutonomousRunRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     if not request.job_ids:
@@ -141,7 +144,7 @@ async def start_autonomous_run(
 
     selected_resume = None
     if request.resume_id:
-        selected_resume = db.query(Resume).filter(Resume.id == request.resume_id).first()
+        selected_resume = db.get(Resume, request.resume_id)
         if not selected_resume:
             raise HTTPException(status_code=404, detail="Selected resume not found")
     else:
@@ -172,25 +175,26 @@ async def start_autonomous_run(
         },
     )
     db.add(run)
-    db.commit()
-    db.refresh(run)
-
-    for job_id in request.job_ids:
-        db.add(
-            AutonomousJobLog(
-                run_id=run.id,
-                job_id=job_id,
-                stage="queued",
-                status="pending",
-                attempts=0,
-                details={"job_id": job_id},
-            )
-        )
+    db.flush()
+
+    # One multi-row INSERT for the per-job logs, committed together with the run.
+    db.execute(
+        insert(AutonomousJobLog),
+        [
+            {
+                "run_id": run.id,
+                "job_id": job_id,
+                "stage": "queued",
+                "status": "pending",
+                "attempts": 0,
+                "details": {"job_id": job_id},
+            }
+            for job_id in request.job_ids
+        ],
+    )
     db.commit()
 
-    coordinator = CoordinatorAgent()
-    background_tasks.add_task(
-        coordinator.run,
+    autonomous_worker.submit(
         run.id,
         request.job_ids,
         selected_resume.id if selected_resume else request.resume_id,
@@ -208,12 +212,37 @@ async def start_autonomous_run(
     )
 
 
+def _etag_matches(request: Request, response: Response, *parts: Any) -> bool:
+    """Set an ETag over `parts` on `response`; True when the client already holds it."""
+    digest = hashlib.md5(":".join(str(p) for p in parts).encode(), usedforsecurity=False).hexdigest()
+    etag = f'"{digest}"'
+    response.headers["ETag"] = etag
+    client_tags = request.headers.get("if-none-match", "")
+    return any(tag.strip().removeprefix("W/") == etag for tag in client_tags.split(","))
+
+
 @router.get("/runs/{run_id}", response_model=AutonomousRunStatusResponse)
-def get_autonomous_run(run_id: int, db: Session = Depends(get_db)):
-    run = db.query(AutonomousRun).filter(AutonomousRun.id == run_id).first()
+def get_autonomous_run(run_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    run = db.get(AutonomousRun, run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Autonomous run not found")
 
+    if _etag_matches(
+        request,
+        response,
+        run.id,
+        run.status,
+        run.total_jobs,
+        run.processed_jobs,
+        run.submitted_jobs,
+        run.failed_jobs,
+        run.skipped_jobs,
+        run.started_at,
+        run.finished_at,
+        run.error_message,
+    ):
+        return Response(status_code=304, headers={"ETag": response.headers["ETag"]})
+
     return AutonomousRunStatusResponse(
         run_id=run.id,
         status=run.status,
@@ -229,7 +258,7 @@ def get_autonomous_run(run_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/active-run")
-def get_active_autonomous_run(db: Session = Depends(get_db)):
+def get_active_autonomous_run(request: Request, response: Response, db: Session = Depends(get_db)):
     run = (
         db.query(AutonomousRun)
         .filter(AutonomousRun.status.in_(["queued", "running"]))
@@ -237,48 +266,75 @@ def get_active_autonomous_run(db: Session = Depends(get_db)):
         .first()
     )
     if not run:
-        return {"run_id": None, "status": "idle"}
-    return {
-        "run_id": run.id,
-        "status": run.status,
-        "total_jobs": run.total_jobs,
-        "processed_jobs": run.processed_jobs,
-        "submitted_jobs": run.submitted_jobs,
-        "failed_jobs": run.failed_jobs,
-        "skipped_jobs": run.skipped_jobs,
-    }
+        payload = {"run_id": None, "status": "idle"}
+    else:
+        payload = {
+            "run_id": run.id,
+            "status": run.status,
+            "total_jobs": run.total_jobs,
+            "processed_jobs": run.processed_jobs,
+            "submitted_jobs": run.submitted_jobs,
+            "failed_jobs": run.failed_jobs,
+            "skipped_jobs": run.skipped_jobs,
+        }
+    if _etag_matches(request, response, *payload.values()):
+        return Response(status_code=304, headers={"ETag": response.headers["ETag"]})
+    return payload
+
+
+_LOG_COLUMNS = (
+    AutonomousJobLog.id,
+    AutonomousJobLog.job_id,
+    AutonomousJobLog.application_id,
+    AutonomousJobLog.stage,
+    AutonomousJobLog.status,
+    AutonomousJobLog.attempts,
+    AutonomousJobLog.resume_version_id,
+    AutonomousJobLog.details,
+    AutonomousJobLog.confirmation,
+    AutonomousJobLog.message,
+    AutonomousJobLog.created_at,
+)
+
+
+def _iter_run_logs(run_id: int, ndjson: bool) -> Iterator[bytes]:
+    # The request-scoped session may be closed before the body is sent, so the
+    # stream reads through its own session and fetches rows in batches.
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            select(*_LOG_COLUMNS)
+            .where(AutonomousJobLog.run_id == run_id)
+            .order_by(AutonomousJobLog.id.asc())
+            .execution_options(yield_per=500)
+        ).mappings()
+        if ndjson:
+            for row in rows:
+                yield orjson.dumps(dict(row)) + b"\n"
+            return
+        yield b"["
+        for index, row in enumerate(rows):
+            yield (b"," if index else b"") + orjson.dumps(dict(row))
+        yield b"]"
+    finally:
+        db.close()
 
 
 @router.get("/runs/{run_id}/logs")
-def get_autonomous_logs(run_id: int, db: Session = Depends(get_db)):
-    run = db.query(AutonomousRun).filter(AutonomousRun.id == run_id).first()
-    if not run:
+def get_autonomous_logs(
+    run_id: int,
+    format: str = Query(default="json", pattern="^(json|ndjson)$"),
+    db: Session = Depends(get_db),
+):
+    if db.get(AutonomousRun, run_id) is None:
         raise HTTPException(status_code=404, detail="Autonomous run not found")
 
-    logs = (
-        db.query(AutonomousJobLog)
-        .filter(AutonomousJobLog.run_id == run_id)
-        .order_by(AutonomousJobLog.id.asc())
-        .all()
+    ndjson = format == "ndjson"
+    return StreamingResponse(
+        _iter_run_logs(run_id, ndjson),
+        media_type="application/x-ndjson" if ndjson else "application/json",
     )
 
-    return [
-        {
-            "id": row.id,
-            "job_id": row.job_id,
-            "application_id": row.application_id,
-            "stage": row.stage,
-            "status": row.status,
-            "attempts": row.attempts,
-            "resume_version_id": row.resume_version_id,
-            "details": row.details,
-            "confirmation": row.confirmation,
-            "message": row.message,
-            "created_at": row.created_at.isoformat() if row.created_at else None,
-        }
-        for row in logs
-    ]
-
 
 @router.get("/heartbeat")
 def get_autonomous_heartbeat(
@@ -287,7 +343,7 @@ def get_autonomous_heartbeat(
     db: Session = Depends(get_db),
 ):
     if run_id is not None:
-        run = db.query(AutonomousRun).filter(AutonomousRun.id == run_id).first()
+        run = db.get(AutonomousRun, run_id)
     else:
         run = (
             db.query(AutonomousRun)
@@ -388,7 +444,7 @@ async def stream_thoughts(db: Session = Depends(get_db)):
 
 @router.post("/runs/{run_id}/stop", response_model=AutonomousStopResponse)
 def stop_autonomous_run(run_id: int, db: Session = Depends(get_db)):
-    run = db.query(AutonomousRun).filter(AutonomousRun.id == run_id).first()
+    run = db.get(AutonomousRun, run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Autonomous run not found")
     if run.status in {"completed", "failed", "stopped"}:
@@ -396,38 +452,37 @@ def stop_autonomous_run(run_id: int, db: Session = Depends(get_db)):
 
     now_iso = datetime.now().isoformat()
     # Request stop on any currently running app under this run so browser loops terminate quickly.
-    app_ids = [
-        row[0]
-        for row in (
-            db.query(AutonomousJobLog.application_id)
-            .filter(
-                AutonomousJobLog.run_id == run.id,
-                AutonomousJobLog.application_id.isnot(None),
-            )
-            .all()
+    run_app_ids = select(AutonomousJobLog.application_id).where(
+        AutonomousJobLog.run_id == run.id,
+        AutonomousJobLog.application_id.isnot(None),
+    )
+    db.execute(
+        update(Application)
+        .where(
+            Application.id.in_(run_app_ids),
+            Application.status.in_([ApplicationStatus.QUEUED, ApplicationStatus.IN_PROGRESS]),
         )
-    ]
-    if app_ids:
-        apps = (
-            db.query(Application)
-            .filter(
-                Application.id.in_(app_ids),
-                Application.status.in_([ApplicationStatus.QUEUED, ApplicationStatus.IN_PROGRESS]),
-            )
-            .all()
+        .values(
+            user_inputs=json_merge(
+                Application.user_inputs,
+                {
+                    "__stop_requested": True,
+                    "__stop_requested_at": now_iso,
+                    "__stop_reason": f"Autonomous run #{run.id} stopped from UI",
+                },
+                db.get_bind().dialect.name,
+            ),
+            notes="Automation stop requested from autonomous run control.",
+            status=ApplicationStatus.REVIEWED,
+            error_message=None,
+            automation_log=func.coalesce(Application.automation_log, "")
+            + "Stop requested from autonomous run control.\n",
         )
-        for app in apps:
-            user_inputs = dict(app.user_inputs or {})
-            user_inputs["__stop_requested"] = True
-            user_inputs["__stop_requested_at"] = now_iso
-            user_inputs["__stop_reason"] = f"Autonomous run #{run.id} stopped from UI"
-            app.user_inputs = user_inputs
-            app.notes = "Automation stop requested from autonomous run control."
-            app.status = ApplicationStatus.REVIEWED
-            app.error_message = None
-            app.automation_log = (app.automation_log or "") + "Stop requested from autonomous run control.\n"
+        .execution_options(synchronize_session=False)
+    )
 
     run.status = "stopped"
     run.finished_at = datetime.now()
     db.commit()
+    invalidate_stats_cache()
     return AutonomousStopResponse(run_id=run.id, status=run.status)
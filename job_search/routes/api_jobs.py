@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import json
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, exists, or_, select, update
+from sqlalchemy.orm import Session, load_only, raiseload
 
 from job_search.database import get_db
 from job_search.models import (
     Job,
-    SearchQuery,
     Application,
     ApplicationStatus,
     ResumeVersion,
@@ -24,45 +23,40 @@ from job_search.schemas.job import (
     JobBulkDeleteRequest,
     JobBulkDeleteResponse,
 )
+from job_search.routes.api_applications import invalidate_stats_cache
+from job_search.services.applier import collect_fallback_target_roles
+from job_search.utils.pagination import after_desc_nulls_last, decode_cursor, encode_cursor
 
 router = APIRouter()
 
-
-def _collect_fallback_target_roles(db: Session, limit: int = 8) -> list[str]:
-    queries = db.query(SearchQuery).order_by(SearchQuery.id.desc()).limit(limit).all()
-    roles: list[str] = []
-    seen: set[str] = set()
-    for q in queries:
-        raw = q.keywords
-        candidates: list[str] = []
-        if not raw:
-            continue
-        if isinstance(raw, str):
-            text = raw.strip()
-            if text.startswith("[") and text.endswith("]"):
-                try:
-                    parsed = json.loads(text)
-                    if isinstance(parsed, list):
-                        candidates = [str(v) for v in parsed if v]
-                    else:
-                        candidates = [text]
-                except Exception:
-                    candidates = [text]
-            else:
-                candidates = [text]
-        elif isinstance(raw, list):
-            candidates = [str(v) for v in raw if v]
-
-        for item in candidates:
-            role = item.strip()
-            if not role:
-                continue
-            norm = role.lower()
-            if norm in seen:
-                continue
-            seen.add(norm)
-            roles.append(role)
-    return roles
+_JOB_SORT_COLUMNS = {
+    "match_score": Job.match_score,
+    "posted_date": Job.posted_date,
+    "scraped_at": Job.scraped_at,
+}
+
+_RESCORE_BATCH_SIZE = 200
+
+# Columns backing JobListItem; description and JSON match data stay unloaded in list views.
+_JOB_LIST_COLUMNS = (
+    Job.id,
+    Job.external_id,
+    Job.source,
+    Job.title,
+    Job.company,
+    Job.location,
+    Job.work_type,
+    Job.employment_type,
+    Job.experience_level,
+    Job.salary_min,
+    Job.salary_max,
+    Job.url,
+    Job.is_easy_apply,
+    Job.posted_date,
+    Job.match_score,
+    Job.is_archived,
+    Job.scraped_at,
+)
 
 
 @router.get("", response_model=JobListResponse)
@@ -75,9 +69,17 @@ def list_jobs(
     sort: str = "match_score",
     search_id: Optional[int] = None,
     application_status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     db: Session = Depends(get_db),
 ):
-    query = db.query(Job).filter(Job.is_archived == is_archived)
+    # Any access outside the list projection (deferred column or relationship) raises
+    # instead of silently issuing one query per row during serialization.
+    query = (
+        db.query(Job)
+        .options(load_only(*_JOB_LIST_COLUMNS, raiseload=True), raiseload("*"))
+        .filter(Job.is_archived == is_archived)
+    )
 
     if search_id:
         query = query.filter(Job.search_query_id == search_id)
@@ -88,42 +90,71 @@ def list_jobs(
         query = query.filter(Job.work_type == work_type)
 
     if application_status:
+        # Semi-/anti-joins: each job appears at most once and the planner can use the job_id index.
         status_l = application_status.lower().strip()
+        has_application = exists().where(Application.job_id == Job.id)
         if status_l == "unapplied":
-            subq = db.query(Application.job_id)
-            query = query.filter(~Job.id.in_(subq))
+            query = query.filter(~has_application)
         elif status_l == "active_pipeline":
-            query = query.join(Application, Application.job_id == Job.id).filter(
-                Application.status.in_([ApplicationStatus.QUEUED, ApplicationStatus.IN_PROGRESS])
+            query = query.filter(
+                has_application.where(
+                    Application.status.in_([ApplicationStatus.QUEUED, ApplicationStatus.IN_PROGRESS])
+                )
             )
         else:
             try:
                 status_enum = ApplicationStatus(status_l)
-                query = query.join(Application, Application.job_id == Job.id).filter(
-                    Application.status == status_enum
-                )
+                query = query.filter(has_application.where(Application.status == status_enum))
             except Exception:
                 pass
 
-    total = query.count()
+    total = query.count() if include_total else None
 
-    if sort == "match_score":
-        query = query.order_by(Job.match_score.desc().nullslast())
-    elif sort == "posted_date":
-        query = query.order_by(Job.posted_date.desc().nullslast())
-    elif sort == "scraped_at":
-        query = query.order_by(Job.scraped_at.desc())
-    else:
+    sort_col = _JOB_SORT_COLUMNS.get(sort)
+    if sort_col is None:
+        sort = "id"
         query = query.order_by(Job.id.desc())
-
-    jobs = query.offset((page - 1) * per_page).limit(per_page).all()
-
-    return JobListResponse(jobs=jobs, total=total, page=page, per_page=per_page)
+    else:
+        query = query.order_by(sort_col.desc().nullslast(), Job.id.desc())
+
+    if cursor:
+        try:
+            cursor_sort, cursor_value, cursor_id = decode_cursor(cursor)
+            if cursor_value is not None and sort in ("posted_date", "scraped_at"):
+                cursor_value = datetime.fromisoformat(cursor_value)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if cursor_sort != sort:
+            raise HTTPException(status_code=400, detail="Cursor does not match sort order")
+        if sort_col is None:
+            query = query.filter(Job.id < cursor_id)
+        else:
+            query = query.filter(after_desc_nulls_last(sort_col, cursor_value, Job.id, cursor_id))
+        jobs = query.limit(per_page + 1).all()
+    else:
+        jobs = query.offset((page - 1) * per_page).limit(per_page + 1).all()
+
+    has_more = len(jobs) > per_page
+    jobs = jobs[:per_page]
+    next_cursor = None
+    if has_more:
+        last = jobs[-1]
+        last_value = getattr(last, sort_col.key) if sort_col is not None else None
+        next_cursor = encode_cursor(sort, last_value, last.id)
+
+    return JobListResponse(
+        jobs=jobs,
+        total=total,
+        page=page,
+        per_page=per_page,
+        has_more=has_more,
+        next_cursor=next_cursor,
+    )
 
 
 @router.get("/{job_id}", response_model=JobResponse)
 def get_job(job_id: int, db: Session = Depends(get_db)):
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = db.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
@@ -134,9 +165,9 @@ async def score_job(job_id: int, request: JobScoreRequest, db: Session = Depends
     """Score a job against the user profile."""
     from job_search.models import UserProfile
     from job_search.services.job_matcher import JobMatcher
-    from job_search.routes.api_resumes import _get_llm_client
+    from job_search.services.llm_client import get_llm_client
 
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = db.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -144,7 +175,7 @@ async def score_job(job_id: int, request: JobScoreRequest, db: Session = Depends
     if not profile:
         raise HTTPException(status_code=400, detail="No profile found. Please set up your profile first.")
 
-    fallback_roles = _collect_fallback_target_roles(db)
+    fallback_roles = collect_fallback_target_roles(db)
     profile_dict = {
         "skills": profile.skills or [],
         "experience": profile.experience or [],
@@ -167,7 +198,7 @@ async def score_job(job_id: int, request: JobScoreRequest, db: Session = Depends
         "work_type": job.work_type,
     }
 
-    llm_client = _get_llm_client() if request.deep else None
+    llm_client = get_llm_client() if request.deep else None
     matcher = JobMatcher(llm_client=llm_client)
 
     if request.deep and llm_client:
@@ -210,7 +241,7 @@ def rescore_all_jobs(db: Session = Depends(get_db)):
     if not profile:
         raise HTTPException(status_code=400, detail="No profile found.")
 
-    fallback_roles = _collect_fallback_target_roles(db)
+    fallback_roles = collect_fallback_target_roles(db)
     profile_dict = {
         "skills": profile.skills or [],
         "experience": profile.experience or [],
@@ -227,45 +258,68 @@ def rescore_all_jobs(db: Session = Depends(get_db)):
     }
 
     matcher = JobMatcher()
-    jobs = db.query(Job).filter(Job.is_archived == False).all()
     updated = 0
+    last_id = 0
+    # Walk jobs in id-ordered batches reading only the scored columns, and write each batch
+    # back with one executemany UPDATE so memory and transaction size stay bounded.
+    while True:
+        batch = db.execute(
+            select(Job.id, Job.title, Job.description, Job.location, Job.work_type)
+            .where(Job.is_archived == False, Job.id > last_id)
+            .order_by(Job.id)
+            .limit(_RESCORE_BATCH_SIZE)
+        ).all()
+        if not batch:
+            break
+
+        job_dicts = [
+            {
+                "title": row.title,
+                "description": row.description or "",
+                "location": row.location or "",
+                "work_type": row.work_type or "",
+            }
+            for row in batch
+        ]
+        updates = []
+        for row, result in zip(batch, matcher.batch_score(job_dicts, profile_dict)):
+            updates.append(
+                {
+                    "id": row.id,
+                    "match_score": result.overall_score,
+                    "match_details": {
+                        "skill_score": result.skill_score,
+                        "title_score": result.title_score,
+                        "experience_score": result.experience_score,
+                        "location_score": result.location_score,
+                        "keyword_score": result.keyword_score,
+                        "vibe_score": result.vibe_score,
+                        "vibe_explanation": result.vibe_explanation,
+                        "matched_skills": result.matched_skills,
+                        "missing_skills": result.missing_skills,
+                        "recommendation": result.recommendation,
+                        "explanation": result.explanation,
+                    },
+                    "extracted_keywords": result.extracted_keywords,
+                }
+            )
 
-    for job in jobs:
-        job_dict = {
-            "title": job.title,
-            "description": job.description or "",
-            "location": job.location or "",
-            "work_type": job.work_type or "",
-        }
-        result = matcher.score_job(job_dict, profile_dict)
-        job.match_score = result.overall_score
-        job.match_details = {
-            "skill_score": result.skill_score,
-            "title_score": result.title_score,
-            "experience_score": result.experience_score,
-            "location_score": result.location_score,
-            "keyword_score": result.keyword_score,
-            "vibe_score": result.vibe_score,
-            "vibe_explanation": result.vibe_explanation,
-            "matched_skills": result.matched_skills,
-            "missing_skills": result.missing_skills,
-            "recommendation": result.recommendation,
-            "explanation": result.explanation,
-        }
-        job.extracted_keywords = result.extracted_keywords
-        updated += 1
+        db.execute(update(Job), updates)
+        db.commit()
+        updated += len(updates)
+        last_id = batch[-1].id
 
-    db.commit()
     return {"message": f"Re-scored {updated} jobs", "updated": updated}
 
 
 @router.post("/{job_id}/archive")
 def archive_job(job_id: int, db: Session = Depends(get_db)):
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = db.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     job.is_archived = True
     db.commit()
+    invalidate_stats_cache()
     return {"message": "Job archived", "job_id": job.id}
 
 
@@ -275,38 +329,41 @@ def bulk_delete_jobs(request: JobBulkDeleteRequest, db: Session = Depends(get_db
     if not job_ids:
         raise HTTPException(status_code=400, detail="No valid job IDs provided.")
 
-    existing_job_ids = [
-        row[0]
-        for row in db.query(Job.id).filter(Job.id.in_(job_ids)).all()
-    ]
-    if not existing_job_ids:
-        return JobBulkDeleteResponse(deleted=0, deleted_ids=[])
-
-    application_ids = [
-        row[0]
-        for row in db.query(Application.id).filter(Application.job_id.in_(existing_job_ids)).all()
-    ]
-
-    if application_ids:
-        db.query(AutonomousJobLog).filter(
+    # Dependents are matched through subqueries, and the final DELETE ... RETURNING reports
+    # which jobs actually existed, so no pre-SELECT round trips are needed.
+    target_app_ids = select(Application.id).where(Application.job_id.in_(job_ids))
+    db.execute(
+        delete(AutonomousJobLog)
+        .where(
             or_(
-                AutonomousJobLog.application_id.in_(application_ids),
-                AutonomousJobLog.job_id.in_(existing_job_ids),
+                AutonomousJobLog.job_id.in_(job_ids),
+                AutonomousJobLog.application_id.in_(target_app_ids),
             )
-        ).delete(synchronize_session=False)
-        db.query(AutomationIssueEvent).filter(
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        delete(AutomationIssueEvent)
+        .where(
             or_(
-                AutomationIssueEvent.application_id.in_(application_ids),
-                AutomationIssueEvent.job_id.in_(existing_job_ids),
+                AutomationIssueEvent.job_id.in_(job_ids),
+                AutomationIssueEvent.application_id.in_(target_app_ids),
             )
-        ).delete(synchronize_session=False)
-        db.query(Application).filter(Application.id.in_(application_ids)).delete(synchronize_session=False)
-    else:
-        db.query(AutonomousJobLog).filter(AutonomousJobLog.job_id.in_(existing_job_ids)).delete(synchronize_session=False)
-        db.query(AutomationIssueEvent).filter(AutomationIssueEvent.job_id.in_(existing_job_ids)).delete(synchronize_session=False)
-
-    db.query(ResumeVersion).filter(ResumeVersion.job_id.in_(existing_job_ids)).delete(synchronize_session=False)
-    db.query(Job).filter(Job.id.in_(existing_job_ids)).delete(synchronize_session=False)
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        delete(Application).where(Application.job_id.in_(job_ids)).execution_options(synchronize_session=False)
+    )
+    db.execute(
+        delete(ResumeVersion).where(ResumeVersion.job_id.in_(job_ids)).execution_options(synchronize_session=False)
+    )
+    deleted_ids = sorted(
+        db.scalars(
+            delete(Job).where(Job.id.in_(job_ids)).returning(Job.id).execution_options(synchronize_session=False)
+        )
+    )
     db.commit()
+    invalidate_stats_cache()
 
-    return JobBulkDeleteResponse(deleted=len(existing_job_ids), deleted_ids=existing_job_ids)
+    return JobBulkDeleteResponse(deleted=len(deleted_ids), deleted_ids=deleted_ids)
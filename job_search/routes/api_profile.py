@@ -1,83 +1,91 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import time
+from typing import Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.orm import Session
 
-from job_search.database import get_db
+from job_search.database import get_db, upsert_insert
 from job_search.models import UserProfile, AutomationIssueEvent
+from job_search.models.user_profile import SINGLETON_PROFILE_ID
 from job_search.schemas.user_profile import UserProfileUpdate, UserProfileResponse
+from job_search.services.learning_summary import build_learning_summary
 
 router = APIRouter()
 
+# Read-mostly analytics payloads, kept as serialized JSON so cache hits skip encoding.
+# Background automation updates the learning data and issue events, which the short TTLs
+# pick up; profile writes here invalidate immediately.
+_RESPONSE_CACHE: dict[str, tuple[float, bytes]] = {}
+_LEARNING_TTL_SECONDS = 60
+_QUESTIONS_TTL_SECONDS = 30
+
+# Profile-driven baseline questionnaire for common screening blockers.
+_PROFILE_CHECKS = (
+    ("expected_ctc_lpa", "What is your expected CTC in LPA?"),
+    ("current_ctc_lpa", "What is your current CTC in LPA?"),
+    ("notice_period_days", "What is your notice period in days?"),
+    ("can_join_immediately", "Can you join immediately?"),
+    ("work_authorization", "What is your work authorization status?"),
+    ("requires_sponsorship", "Do you require visa/work sponsorship?"),
+    ("willing_to_relocate", "Are you willing to relocate if required?"),
+)
+
+# (profile column, parsed-resume key) pairs copied by import-from-resume.
+_RESUME_PROFILE_FIELDS = (
+    ("full_name", "name"),
+    ("email", "email"),
+    ("phone", "phone"),
+    ("location", "location"),
+    ("linkedin_url", "linkedin_url"),
+    ("headline", "headline"),
+    ("summary", "summary"),
+    ("skills", "skills"),
+    ("experience", "experience"),
+    ("education", "education"),
+)
+
+
+def _cached_response(key: str, ttl: int) -> Optional[Response]:
+    cached = _RESPONSE_CACHE.get(key)
+    if cached and time.time() - cached[0] < ttl:
+        return Response(content=cached[1], media_type="application/json")
+    return None
+
+
+def _cache_response(key: str, payload: dict) -> Response:
+    body = orjson.dumps(payload)
+    _RESPONSE_CACHE[key] = (time.time(), body)
+    return Response(content=body, media_type="application/json")
+
+
+def invalidate_profile_cache() -> None:
+    _RESPONSE_CACHE.clear()
+
 
 def _get_or_create_profile(db: Session) -> UserProfile:
     """Get the single user profile, or create a blank one."""
-    profile = db.query(UserProfile).first()
-    if not profile:
-        profile = UserProfile(full_name="", email="")
-        db.add(profile)
+    # Primary-key lookup: served from the identity map on repeat calls within a session.
+    profile = db.get(UserProfile, SINGLETON_PROFILE_ID)
+    if profile is None:
+        # Databases created before the seeded row keep whichever profile they already have.
+        profile = db.scalar(select(UserProfile).order_by(UserProfile.id).limit(1))
+    if profile is None:
+        # Concurrent first hits both attempt the insert; the loser's is ignored.
+        db.execute(
+            upsert_insert(UserProfile, db.get_bind().dialect.name)
+            .values(id=SINGLETON_PROFILE_ID, full_name="", email="")
+            .on_conflict_do_nothing()
+        )
         db.commit()
-        db.refresh(profile)
+        profile = db.get(UserProfile, SINGLETON_PROFILE_ID)
     return profile
 
 
 def _learning_summary(profile: UserProfile) -> dict:
     data = profile.application_answers if isinstance(profile.application_answers, dict) else {}
-    learning = data.get("__learning") if isinstance(data, dict) else None
-    if not isinstance(learning, dict):
-        return {
-            "enabled": False,
-            "totals": {"runs": 0, "submitted": 0, "reviewed": 0, "failed": 0},
-            "top_blockers": [],
-            "top_missing_inputs": [],
-            "top_domain_outcomes": [],
-            "top_learned_field_values": {},
-        }
-
-    def _top_items(mapping: dict, limit: int = 8):
-        if not isinstance(mapping, dict):
-            return []
-        ordered = sorted(mapping.items(), key=lambda item: int(item[1]) if str(item[1]).isdigit() else 0, reverse=True)
-        return [{"key": k, "count": int(v) if str(v).isdigit() else 0} for k, v in ordered[:limit]]
-
-    field_success = learning.get("field_success")
-    top_values = {}
-    if isinstance(field_success, dict):
-        for field_key, value_counts in field_success.items():
-            if not isinstance(value_counts, dict):
-                continue
-            best = sorted(
-                value_counts.items(),
-                key=lambda item: int(item[1]) if str(item[1]).isdigit() else 0,
-                reverse=True,
-            )
-            if best:
-                top_values[field_key] = {"value": best[0][0], "count": int(best[0][1]) if str(best[0][1]).isdigit() else 0}
-
-    domain_stats = learning.get("domain_stats")
-    top_domains = []
-    if isinstance(domain_stats, dict):
-        for domain, stats in domain_stats.items():
-            if not isinstance(stats, dict):
-                continue
-            top_domains.append(
-                {
-                    "domain": domain,
-                    "runs": int(stats.get("runs", 0)),
-                    "submitted": int(stats.get("submitted", 0)),
-                    "failed": int(stats.get("failed", 0)),
-                    "reviewed": int(stats.get("reviewed", 0)),
-                }
-            )
-        top_domains.sort(key=lambda item: item["runs"], reverse=True)
-
-    return {
-        "enabled": True,
-        "totals": learning.get("totals") or {"runs": 0, "submitted": 0, "reviewed": 0, "failed": 0},
-        "top_blockers": _top_items(learning.get("blocker_counts") or {}),
-        "top_missing_inputs": _top_items(learning.get("missing_required_inputs") or {}),
-        "top_domain_outcomes": top_domains[:10],
-        "top_learned_field_values": top_values,
-        "updated_at": learning.get("updated_at"),
-    }
+    return build_learning_summary(data.get("__learning"))
 
 
 @router.get("", response_model=UserProfileResponse)
@@ -88,9 +96,14 @@ def get_profile(db: Session = Depends(get_db)):
 @router.put("", response_model=UserProfileResponse)
 def update_profile(data: UserProfileUpdate, db: Session = Depends(get_db)):
     profile = _get_or_create_profile(db)
-    for field, value in data.model_dump(exclude_unset=True).items():
+    updates = data.model_dump(exclude_unset=True)
+    for field, value in updates.items():
         setattr(profile, field, value)
+    if "application_answers" in updates:
+        # Replacing the answers may rewrite "__learning"; keep the stored summary in step.
+        profile.learning_summary_cache = _learning_summary(profile)
     db.commit()
+    invalidate_profile_cache()
     db.refresh(profile)
     return profile
 
@@ -100,36 +113,38 @@ def import_from_resume(resume_id: int, db: Session = Depends(get_db)):
     """Populate profile fields from a parsed resume."""
     from job_search.models import Resume
 
-    resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    resume = db.get(Resume, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     if not resume.parsed_data:
         raise HTTPException(status_code=400, detail="Resume has not been parsed yet")
 
-    profile = _get_or_create_profile(db)
     parsed = resume.parsed_data
-
-    field_mapping = {
-        "full_name": "name",
-        "email": "email",
-        "phone": "phone",
-        "location": "location",
-        "linkedin_url": "linkedin_url",
-        "headline": "headline",
-        "summary": "summary",
-        "skills": "skills",
-        "experience": "experience",
-        "education": "education",
+    values = {
+        profile_field: parsed[resume_field]
+        for profile_field, resume_field in _RESUME_PROFILE_FIELDS
+        if parsed.get(resume_field)
     }
 
-    for profile_field, resume_field in field_mapping.items():
-        value = parsed.get(resume_field)
-        if value:
-            setattr(profile, profile_field, value)
-
+    # Update the singleton profile in place (one statement); only insert when none exists yet.
+    profile_id_subq = select(func.min(UserProfile.id)).scalar_subquery()
+    if values:
+        profile_id = db.scalar(
+            update(UserProfile)
+            .where(UserProfile.id == profile_id_subq)
+            .values(**values)
+            .returning(UserProfile.id)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        profile_id = db.scalar(select(profile_id_subq))
+    if profile_id is None:
+        profile_id = db.scalar(
+            insert(UserProfile).values(**{"full_name": "", "email": "", **values}).returning(UserProfile.id)
+        )
     db.commit()
-    db.refresh(profile)
-    return {"message": "Profile updated from resume", "profile_id": profile.id}
+    invalidate_profile_cache()
+    return {"message": "Profile updated from resume", "profile_id": profile_id}
 
 
 @router.get("/application-questions")
@@ -140,64 +155,65 @@ def application_questions(
     """
     Suggest targeted user questions based on observed automation issues + missing profile inputs.
     """
-    profile = _get_or_create_profile(db)
+    cache_key = f"questions:{limit}"
+    cached = _cached_response(cache_key, _QUESTIONS_TTL_SECONDS)
+    if cached is not None:
+        return cached
 
-    suggestions: list[dict] = []
-    seen = set()
+    profile = _get_or_create_profile(db)
 
-    issue_rows = (
-        db.query(AutomationIssueEvent)
-        .filter(AutomationIssueEvent.event_type == "detected")
+    # Plain column tuples: no instance construction, and the unused JSON/text columns stay in the DB.
+    issue_rows = db.execute(
+        select(
+            AutomationIssueEvent.suggested_questions,
+            AutomationIssueEvent.category,
+            AutomationIssueEvent.source,
+            AutomationIssueEvent.domain,
+            AutomationIssueEvent.message,
+        )
+        .where(AutomationIssueEvent.event_type == "detected")
         .order_by(AutomationIssueEvent.id.desc())
         .limit(limit)
-        .all()
-    )
-    for row in issue_rows:
-        for q in row.suggested_questions or []:
-            key = ("issue", q)
-            if key in seen:
-                continue
-            seen.add(key)
-            suggestions.append(
-                {
-                    "question": q,
-                    "category": row.category,
-                    "source": row.source,
-                    "domain": row.domain,
-                    "reason": row.message,
-                }
-            )
-
-    # Profile-driven baseline questionnaire for common screening blockers.
-    profile_checks = [
-        ("expected_ctc_lpa", "What is your expected CTC in LPA?"),
-        ("current_ctc_lpa", "What is your current CTC in LPA?"),
-        ("notice_period_days", "What is your notice period in days?"),
-        ("can_join_immediately", "Can you join immediately?"),
-        ("work_authorization", "What is your work authorization status?"),
-        ("requires_sponsorship", "Do you require visa/work sponsorship?"),
-        ("willing_to_relocate", "Are you willing to relocate if required?"),
+    ).all()
+    issue_seen: set[str] = set()
+    suggestions = [
+        {
+            "question": q,
+            "category": row.category,
+            "source": row.source,
+            "domain": row.domain,
+            "reason": row.message,
+        }
+        for row in issue_rows
+        for q in row.suggested_questions or []
+        # Keep the newest occurrence of each question (set.add returns None).
+        if q not in issue_seen and not issue_seen.add(q)
     ]
-    for attr, question in profile_checks:
-        if getattr(profile, attr, None) is None or getattr(profile, attr, None) == "":
-            key = ("profile", question)
-            if key in seen:
-                continue
-            seen.add(key)
-            suggestions.append(
-                {
-                    "question": question,
-                    "category": "profile_input_missing",
-                    "source": None,
-                    "domain": None,
-                    "reason": f"Missing profile field: {attr}",
-                }
-            )
-
-    return {"count": len(suggestions), "questions": suggestions}
+
+    # False / 0 are real answers (e.g. "no sponsorship needed"), so only None and "" count as missing.
+    profile_values = [(attr, question, getattr(profile, attr, None)) for attr, question in _PROFILE_CHECKS]
+    suggestions.extend(
+        {
+            "question": question,
+            "category": "profile_input_missing",
+            "source": None,
+            "domain": None,
+            "reason": f"Missing profile field: {attr}",
+        }
+        for attr, question, value in profile_values
+        if value is None or value == ""
+    )
+
+    payload = {"count": len(suggestions), "questions": suggestions}
+    return _cache_response(cache_key, payload)
 
 
 @router.get("/automation-learning")
 def get_automation_learning(db: Session = Depends(get_db)):
+    cached = _cached_response("learning", _LEARNING_TTL_SECONDS)
+    if cached is not None:
+        return cached
     profile = _get_or_create_profile(db)
-    return _learning_summary(profile)
+    # Rendered by the learning writer; profiles that predate the column are summarized here.
+    payload = profile.learning_summary_cache or _learning_summary(profile)
+    return _cache_response("learning", payload)
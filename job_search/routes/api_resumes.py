@@ -1,34 +1,51 @@
 from __future__ import annotations
-from typing import Optional
+from typing import BinaryIO, Optional
 
-import shutil
+import asyncio
+import hashlib
+import os
+import tempfile
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, defer, raiseload
 
 from job_search.database import get_db
 from job_search.models import Resume, ResumeVersion
 from job_search.schemas.resume import ResumeResponse, ResumeVersionResponse, TailorRequest
 from job_search.services.resume_parser import ResumeParser
-from job_search.services.llm_client import LLMClient, LLMProvider
-from job_search.config import settings
+from job_search.services.llm_client import get_llm_client
 
 router = APIRouter()
 
+# Read endpoints serialize through ResumeResponse, which needs neither raw_text nor the
+# versions relationship; touching either raises instead of issuing a hidden SELECT.
+_RESUME_READ_OPTIONS = (defer(Resume.raw_text, raiseload=True), raiseload("*"))
+
 UPLOAD_DIR = Path("job_search/static/uploads")
+_UPLOAD_CHUNK_BYTES = 1 << 20
+
+
+def _save_upload(source: BinaryIO, dest_dir: Path) -> tuple[Path, str]:
+    """Copy an upload into a temporary file in dest_dir, hashing it in the same pass."""
+    digest = hashlib.sha256()
+    fd, tmp_name = tempfile.mkstemp(dir=dest_dir, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := source.read(_UPLOAD_CHUNK_BYTES):
+                digest.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return Path(tmp_name), digest.hexdigest()
 
 
-def _get_llm_client() -> Optional[LLMClient]:
-    """Create an LLM client if API keys are configured."""
-    if settings.llm_provider == "ollama":
-        return LLMClient(LLMProvider.OLLAMA, None, settings.llm_model, settings.ollama_base_url)
-    elif settings.llm_provider == "claude" and settings.anthropic_api_key:
-        return LLMClient(LLMProvider.CLAUDE, settings.anthropic_api_key, settings.llm_model)
-    elif settings.llm_provider == "openai" and settings.openai_api_key:
-        return LLMClient(LLMProvider.OPENAI, settings.openai_api_key, settings.llm_model)
-    return None
+def _resume_by_hash(db: Session, content_hash: str) -> Optional[Resume]:
+    return db.query(Resume).options(*_RESUME_READ_OPTIONS).filter(Resume.content_hash == content_hash).first()
 
 
 @router.post("/upload", response_model=ResumeResponse)
@@ -45,14 +62,18 @@ async def upload_resume(
     if suffix not in (".pdf", ".docx", ".doc"):
         raise HTTPException(status_code=400, detail="Only PDF and DOCX files are supported")
 
-    # Save uploaded file
+    # Save uploaded file off the event loop; identical re-uploads reuse the parsed resume.
     UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path, content_hash = await asyncio.to_thread(_save_upload, file.file, UPLOAD_DIR)
+    existing = _resume_by_hash(db, content_hash)
+    if existing:
+        tmp_path.unlink(missing_ok=True)
+        return existing
     file_path = UPLOAD_DIR / file.filename
-    with open(file_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+    tmp_path.replace(file_path)
 
     # Parse resume
-    llm_client = _get_llm_client()
+    llm_client = get_llm_client()
     parser = ResumeParser(llm_client=llm_client)
 
     try:
@@ -67,22 +88,33 @@ async def upload_resume(
         file_type=parsed.file_type,
         parsed_data=parsed.structured_data,
         raw_text=parsed.raw_text,
-        is_primary=db.query(Resume).count() == 0,  # First resume is primary
+        content_hash=content_hash,
+        is_primary=db.scalar(select(Resume.id).limit(1)) is None,  # First resume is primary
     )
     db.add(resume)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent upload of the same bytes committed first; hand back its row.
+        db.rollback()
+        existing = _resume_by_hash(db, content_hash)
+        if existing is None:
+            raise
+        if existing.file_path != str(file_path):
+            file_path.unlink(missing_ok=True)
+        return existing
     db.refresh(resume)
     return resume
 
 
 @router.get("", response_model=list[ResumeResponse])
 def list_resumes(db: Session = Depends(get_db)):
-    return db.query(Resume).order_by(Resume.created_at.desc()).all()
+    return db.query(Resume).options(*_RESUME_READ_OPTIONS).order_by(Resume.created_at.desc()).all()
 
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
 def get_resume(resume_id: int, db: Session = Depends(get_db)):
-    resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    resume = db.get(Resume, resume_id, options=_RESUME_READ_OPTIONS)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     return resume
@@ -92,6 +124,7 @@ def get_resume(resume_id: int, db: Session = Depends(get_db)):
 def list_resume_versions(resume_id: int, db: Session = Depends(get_db)):
     return (
         db.query(ResumeVersion)
+        .options(raiseload("*"))
         .filter(ResumeVersion.base_resume_id == resume_id)
         .order_by(ResumeVersion.created_at.desc())
         .all()
@@ -100,7 +133,7 @@ def list_resume_versions(resume_id: int, db: Session = Depends(get_db)):
 
 @router.get("/versions/{version_id}/download")
 def download_version(version_id: int, db: Session = Depends(get_db)):
-    version = db.query(ResumeVersion).filter(ResumeVersion.id == version_id).first()
+    version = db.get(ResumeVersion, version_id)
     if not version:
         raise HTTPException(status_code=404, detail="Resume version not found")
     file_path = Path(version.file_path)
@@ -114,17 +147,17 @@ async def tailor_resume(resume_id: int, request: TailorRequest, db: Session = De
     """Generate a tailored resume version for a specific job."""
     from job_search.models import Job
 
-    resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    resume = db.get(Resume, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     if not resume.parsed_data:
         raise HTTPException(status_code=400, detail="Resume has not been parsed")
 
-    job = db.query(Job).filter(Job.id == request.job_id).first()
+    job = db.get(Job, request.job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    llm_client = _get_llm_client()
+    llm_client = get_llm_client()
     if not llm_client:
         raise HTTPException(status_code=500, detail="No LLM API key configured")
 
@@ -144,7 +177,9 @@ async def tailor_resume(resume_id: int, request: TailorRequest, db: Session = De
     generator = ResumeGenerator()
     tailored_data = dict(resume.parsed_data)
     tailored_data.update(result.modified_sections)
-    output_path = generator.generate_pdf(
+    # WeasyPrint rendering is synchronous and CPU-bound; keep it off the event loop.
+    output_path = await asyncio.to_thread(
+        generator.generate_pdf,
         tailored_data,
         output_filename=f"resume_{resume_id}_job_{job.id}.pdf",
         require_pdf=False,
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+from collections import Counter, OrderedDict
+from functools import partial
+from operator import attrgetter
 from datetime import datetime
-import json
+import threading
+import time
 import uuid
+import weakref
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
+import orjson
 
-from job_search.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session, load_only
+
+from job_search.database import get_db, upsert_insert
 from job_search.models import SearchQuery, Job, UserProfile
 from job_search.schemas.search import SearchQueryCreate, SearchQueryResponse, SearchRunRequest
+from job_search.utils.background import spawn
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -20,10 +30,67 @@ logger = logging.getLogger(__name__)
 # In-memory status tracker for running/recent searches.
 active_searches: dict[str, dict[str, Any]] = {}
 
+# Finished searches stay queryable for a grace window so pollers can read the final
+# state, then are evicted; otherwise the map grows by one entry per run forever.
+# Running searches are never evicted. Sync handlers run in the threadpool while the
+# search tasks run on the event loop, so membership changes and scans hold the lock.
+_FINISHED_SEARCH_TTL_SECONDS = 3600
+_MAX_FINISHED_SEARCHES = 1024
+_finished_searches: OrderedDict[str, float] = OrderedDict()
+_searches_lock = threading.Lock()
+# Semaphores bind to the loop that first waits on them, so slots are kept per loop.
+_SEARCH_SLOTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Upper bound on simultaneous scraper calls (browser sessions / HTTP fan-out) per search.
+# LinkedIn calls share one browser storage state, so they always run one at a time.
+_SCRAPE_CONCURRENCY = 4
+
+
+def _prune_finished_searches(now: float | None = None) -> None:
+    """Evict expired or excess finished searches. Caller holds _searches_lock."""
+    now = time.monotonic() if now is None else now
+    while _finished_searches:
+        search_id, finished = next(iter(_finished_searches.items()))
+        if len(_finished_searches) <= _MAX_FINISHED_SEARCHES and now - finished < _FINISHED_SEARCH_TTL_SECONDS:
+            break
+        _finished_searches.popitem(last=False)
+        active_searches.pop(search_id, None)
+
+
+# Profile fields handed to the matcher, grouped by the empty value they default to.
+_PROFILE_LIST_FIELDS = ("skills", "target_roles", "target_locations", "experience")
+_PROFILE_TEXT_FIELDS = (
+    "summary",
+    "headline",
+    "technical_manifesto",
+    "preferred_team_style",
+    "execution_preference",
+    "company_stage_preference",
+    "autonomy_preference",
+)
+_get_profile_lists = attrgetter(*_PROFILE_LIST_FIELDS)
+_get_profile_texts = attrgetter(*_PROFILE_TEXT_FIELDS)
+
+# Columns read by _profile_can_score and _profile_to_dict; the large JSON blobs
+# (application answers, learning cache) are never needed for a search run.
+_SCORING_PROFILE_COLUMNS = tuple(
+    getattr(UserProfile, field)
+    for field in ("id", *_PROFILE_LIST_FIELDS, *_PROFILE_TEXT_FIELDS, "frontier_tech_interest")
+)
+
+_SCORABLE_PROFILE_FIELDS = ("skills", "target_roles", "experience", "summary", "technical_manifesto")
+
 
 def _ensure_profile(db: Session) -> tuple[UserProfile, bool]:
     """Return latest profile, auto-creating a blank profile if needed."""
-    profile = db.query(UserProfile).order_by(UserProfile.id.desc()).first()
+    profile = (
+        db.query(UserProfile)
+        .options(load_only(*_SCORING_PROFILE_COLUMNS))
+        .order_by(UserProfile.id.desc())
+        .first()
+    )
     auto_created = False
     if not profile:
         profile = UserProfile(full_name="", email="")
@@ -37,44 +104,19 @@ def _ensure_profile(db: Session) -> tuple[UserProfile, bool]:
 def _profile_can_score(profile: UserProfile | None) -> bool:
     if not profile:
         return False
-    has_skills = bool(profile.skills)
-    has_roles = bool(profile.target_roles)
-    has_experience = bool(profile.experience)
-    has_summary = bool(profile.summary)
-    has_manifesto = bool(profile.technical_manifesto)
-    return has_skills or has_roles or has_experience or has_summary or has_manifesto
+    return any(getattr(profile, field) for field in _SCORABLE_PROFILE_FIELDS)
 
 
 def _profile_to_dict(profile: UserProfile | None) -> dict[str, Any]:
     if not profile:
-        return {
-            "skills": [],
-            "target_roles": [],
-            "target_locations": [],
-            "experience": [],
-            "summary": "",
-            "headline": "",
-            "technical_manifesto": "",
-            "preferred_team_style": "",
-            "execution_preference": "",
-            "company_stage_preference": "",
-            "autonomy_preference": "",
-            "frontier_tech_interest": None,
-        }
-    return {
-        "skills": profile.skills or [],
-        "target_roles": profile.target_roles or [],
-        "target_locations": profile.target_locations or [],
-        "experience": profile.experience or [],
-        "summary": profile.summary or "",
-        "headline": profile.headline or "",
-        "technical_manifesto": profile.technical_manifesto or "",
-        "preferred_team_style": profile.preferred_team_style or "",
-        "execution_preference": profile.execution_preference or "",
-        "company_stage_preference": profile.company_stage_preference or "",
-        "autonomy_preference": profile.autonomy_preference or "",
-        "frontier_tech_interest": profile.frontier_tech_interest,
-    }
+        data: dict[str, Any] = {field: [] for field in _PROFILE_LIST_FIELDS}
+        data.update(dict.fromkeys(_PROFILE_TEXT_FIELDS, ""))
+        data["frontier_tech_interest"] = None
+        return data
+    data = {field: value or [] for field, value in zip(_PROFILE_LIST_FIELDS, _get_profile_lists(profile))}
+    data.update((field, value or "") for field, value in zip(_PROFILE_TEXT_FIELDS, _get_profile_texts(profile)))
+    data["frontier_tech_interest"] = profile.frontier_tech_interest
+    return data
 
 
 def _unscored_match_details(reason: str) -> dict[str, Any]:
@@ -90,6 +132,46 @@ def _unscored_match_details(reason: str) -> dict[str, Any]:
     }
 
 
+def _scored_match_details(result: Any) -> dict[str, Any]:
+    """The subset of a MatchResult stored on jobs saved by a search run."""
+    return {
+        "skill_score": result.skill_score,
+        "vibe_score": result.vibe_score,
+        "title_score": result.title_score,
+        "explanation": result.explanation,
+        "vibe_explanation": result.vibe_explanation,
+        "matched_skills": result.matched_skills,
+        "missing_skills": result.missing_skills,
+    }
+
+
+def _job_row(
+    job_data: dict[str, Any],
+    source: str,
+    external_id: str,
+    match_score: float,
+    match_details: dict[str, Any],
+    search_query_id: int | None,
+) -> dict[str, Any]:
+    """Column values for inserting one scraped posting as a Job row, with the scraper's defaults filled in."""
+    return {
+        "external_id": external_id or None,
+        "source": source,
+        "title": job_data.get("title"),
+        "company": job_data.get("company", "Unknown"),
+        "location": job_data.get("location", ""),
+        "work_type": job_data.get("work_type", "onsite"),
+        "is_easy_apply": job_data.get("is_easy_apply", False),
+        "apply_url": job_data.get("apply_url"),
+        "description": job_data.get("description", ""),
+        "description_html": job_data.get("description_html", ""),
+        "url": job_data.get("url", ""),
+        "match_score": match_score,
+        "match_details": match_details,
+        "search_query_id": search_query_id,
+    }
+
+
 def _infer_roles_from_keywords(raw_keywords: Any) -> list[str]:
     if raw_keywords is None:
         return []
@@ -99,18 +181,23 @@ def _infer_roles_from_keywords(raw_keywords: Any) -> list[str]:
         items = [str(k) for k in raw_keywords if k]
     else:
         items = [str(raw_keywords)]
-    roles: list[str] = []
-    seen: set[str] = set()
-    for item in items:
-        role = item.strip()
-        if not role:
-            continue
-        norm = role.lower()
-        if norm in seen:
-            continue
-        seen.add(norm)
-        roles.append(role)
-    return roles
+    # Case-insensitive dedupe in one pass; setdefault keeps the first spelling and order.
+    roles: dict[str, str] = {}
+    for role in filter(None, map(str.strip, items)):
+        roles.setdefault(role.lower(), role)
+    return list(roles.values())
+
+
+def _json_list(values: list[str] | None) -> str | None:
+    """Encode an optional request list for the JSON-text columns on SearchQuery."""
+    return orjson.dumps(values).decode() if values else None
+
+
+def _clean_text(value: Any) -> str:
+    """Stripped string form of a scraped field; scrapers mostly return str already."""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip() if value else ""
 
 
 def _register_status_warning(search_id: str, warning: str):
@@ -122,30 +209,112 @@ def _register_status_warning(search_id: str, warning: str):
         warnings.append(warning)
 
 
-def _mark_completed(search_id: str, state: str):
-    if search_id not in active_searches:
+def _request_cancel(data: dict[str, Any]):
+    data["cancelled"] = True
+    data["state"] = "cancelled"
+    cancel_event = data.get("cancel_event")
+    if cancel_event is not None:
+        cancel_event.set()
+
+
+def _mark_completed(search_id: str, state: str) -> int | None:
+    """Finish a run in memory; returns its SearchQuery id for the caller to persist."""
+    with _searches_lock:
+        data = active_searches.get(search_id)
+        if data is None:
+            return None
+        data["state"] = state
+        data["finished_at"] = datetime.now().isoformat()
+        _finished_searches[search_id] = time.monotonic()
+        _finished_searches.move_to_end(search_id)
+        _prune_finished_searches()
+    return data.get("db_search_id")
+
+
+async def _finish_search(search_id: str, state: str):
+    """Mark a run finished, writing its row in a worker thread so the event loop keeps serving."""
+    db_search_id = _mark_completed(search_id, state)
+    if db_search_id:
+        await asyncio.to_thread(_persist_run_state, db_search_id, state)
+
+
+def _persist_run_state(db_search_id: int | None, state: str):
+    """Record a run's lifecycle state on its SearchQuery row, the durable copy of active_searches."""
+    if not db_search_id:
         return
-    active_searches[search_id]["state"] = state
-    active_searches[search_id]["finished_at"] = datetime.now().isoformat()
+    from job_search.database import SessionLocal
+
+    try:
+        with SessionLocal() as db:
+            db.execute(update(SearchQuery).where(SearchQuery.id == db_search_id).values(run_state=state))
+            db.commit()
+    except Exception as e:
+        logger.warning(f"Failed to persist state for search query {db_search_id}: {e}")
+
+
+def mark_interrupted_searches() -> int:
+    """
+    Flag runs left queued/running by a previous process as interrupted. Called at startup,
+    before any new run exists; their in-memory tasks died with that process. Runs live in
+    this process's active_searches, so the app assumes a single worker process.
+    """
+    from job_search.database import SessionLocal
+
+    with SessionLocal() as db:
+        result = db.execute(
+            update(SearchQuery)
+            .where(SearchQuery.run_state.in_(("queued", "running")))
+            .values(run_state="interrupted")
+        )
+        db.commit()
+        return result.rowcount
+
+
+# Columns backing SearchQueryResponse; run bookkeeping and portal lists stay unloaded.
+_QUERY_LIST_COLUMNS = (
+    SearchQuery.id,
+    SearchQuery.name,
+    SearchQuery.keywords,
+    SearchQuery.locations,
+    SearchQuery.work_types,
+    SearchQuery.experience_levels,
+    SearchQuery.date_posted,
+    SearchQuery.easy_apply_only,
+    SearchQuery.is_active,
+    SearchQuery.results_count,
+)
 
 
 @router.get("/queries", response_model=list[SearchQueryResponse])
-def list_queries(db: Session = Depends(get_db)):
-    return db.query(SearchQuery).order_by(SearchQuery.created_at.desc()).all()
+def list_queries(
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    # Bounded page: the table gains a row per search run, so an unpaged listing grows forever.
+    return (
+        db.query(SearchQuery)
+        .options(load_only(*_QUERY_LIST_COLUMNS, raiseload=True))
+        .order_by(SearchQuery.created_at.desc(), SearchQuery.id.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
 
 
 @router.post("/queries", response_model=SearchQueryResponse)
 def create_query(request: SearchQueryCreate, db: Session = Depends(get_db)):
-    query = SearchQuery(**request.model_dump())
-    db.add(query)
+    # RETURNING hands back the generated columns with the INSERT; the response is built
+    # before commit expires the row, so no follow-up SELECT is issued.
+    query = db.scalars(insert(SearchQuery).values(**request.model_dump()).returning(SearchQuery)).one()
+    response = SearchQueryResponse.model_validate(query)
     db.commit()
-    db.refresh(query)
-    return query
+    return response
 
 
 @router.get("/queries/{query_id}", response_model=SearchQueryResponse)
 def get_query(query_id: int, db: Session = Depends(get_db)):
-    query = db.query(SearchQuery).filter(SearchQuery.id == query_id).first()
+    query = db.get(SearchQuery, query_id)
     if not query:
         raise HTTPException(status_code=404, detail="Search query not found")
     return query
@@ -153,7 +322,7 @@ def get_query(query_id: int, db: Session = Depends(get_db)):
 
 @router.delete("/queries/{query_id}")
 def delete_query(query_id: int, db: Session = Depends(get_db)):
-    query = db.query(SearchQuery).filter(SearchQuery.id == query_id).first()
+    query = db.get(SearchQuery, query_id)
     if not query:
         raise HTTPException(status_code=404, detail="Search query not found")
     db.delete(query)
@@ -163,69 +332,80 @@ def delete_query(query_id: int, db: Session = Depends(get_db)):
 
 @router.post("/stop/{search_id}")
 async def stop_search(search_id: str):
-    if search_id in active_searches:
-        active_searches[search_id]["cancelled"] = True
-        active_searches[search_id]["state"] = "cancelled"
+    # Single lookup: a membership test followed by indexing could race with eviction.
+    data = active_searches.get(search_id)
+    if data is not None:
+        _request_cancel(data)
         return {"message": "Search stop requested", "search_id": search_id}
     raise HTTPException(status_code=404, detail="Search not found or already completed")
 
 
 @router.post("/stop-all")
 async def stop_all_searches():
-    count = 0
-    for search_id in list(active_searches.keys()):
-        active_searches[search_id]["cancelled"] = True
-        active_searches[search_id]["state"] = "cancelled"
-        count += 1
+    with _searches_lock:
+        searches = list(active_searches.values())
+    for data in searches:
+        _request_cancel(data)
+    count = len(searches)
     return {"message": f"Requested stop for {count} active searches. Progress indicators should clear shortly."}
 
 
 @router.post("/run")
-async def run_search(request: SearchRunRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+async def run_search(request: SearchRunRequest, db: Session = Depends(get_db)):
     """Trigger a background job search across selected portals."""
     search_id = str(uuid.uuid4())
+    # Dumped once and shared read-only by the status entry, the task and the response.
+    params = request.model_dump()
 
     keywords_str = ", ".join(request.keywords) if isinstance(request.keywords, list) else request.keywords
 
     db_search_id = None
     try:
-        db_query = SearchQuery(
-            name=f"Run: {keywords_str}"[:50],
-            keywords=keywords_str,
-            locations=json.dumps(request.locations) if request.locations else None,
-            work_types=json.dumps(request.work_types) if request.work_types else None,
-            experience_levels=json.dumps(request.experience_levels) if request.experience_levels else None,
-            portals=json.dumps(request.portals) if request.portals else None,
-            custom_portal_urls=json.dumps(request.custom_portal_urls) if request.custom_portal_urls else None,
-            date_posted=request.date_posted,
-            easy_apply_only=request.easy_apply_only,
-            results_count=0,
+        db_search_id = db.scalar(
+            insert(SearchQuery)
+            .values(
+                name=f"Run: {keywords_str}"[:50],
+                keywords=keywords_str,
+                locations=_json_list(request.locations),
+                work_types=_json_list(request.work_types),
+                experience_levels=_json_list(request.experience_levels),
+                portals=_json_list(request.portals),
+                custom_portal_urls=_json_list(request.custom_portal_urls),
+                date_posted=request.date_posted,
+                easy_apply_only=request.easy_apply_only,
+                results_count=0,
+                run_id=search_id,
+                run_state="queued",
+            )
+            .returning(SearchQuery.id)
         )
-        db.add(db_query)
         db.commit()
-        db.refresh(db_query)
-        db_search_id = db_query.id
     except Exception as e:
         logger.error(f"Failed to save search query: {e}")
 
-    active_searches[search_id] = {
-        "cancelled": False,
-        "started_at": datetime.now().isoformat(),
-        "db_search_id": db_search_id,
-        "params": request.model_dump(),
-        "state": "queued",
-        "saved_jobs": 0,
-        "scored_jobs": 0,
-        "unscored_jobs": 0,
-        "warnings": [],
-        "source_breakdown": {},
-    }
+    with _searches_lock:
+        _prune_finished_searches()
+        active_searches[search_id] = {
+            "cancelled": False,
+            # Scrapers poll cancel_event.is_set directly; "cancelled" mirrors it for status reads.
+            "cancel_event": threading.Event(),
+            "started_at": datetime.now().isoformat(),
+            "started_at_ts": time.time(),
+            "db_search_id": db_search_id,
+            "params": params,
+            "state": "queued",
+            "saved_jobs": 0,
+            "scored_jobs": 0,
+            "unscored_jobs": 0,
+            "warnings": [],
+            "source_breakdown": {},
+        }
 
-    background_tasks.add_task(_run_search_task, request.model_dump(), search_id, db_search_id)
+    spawn(_run_search_task(params, search_id, db_search_id), name=f"search-{search_id}")
     return {
         "status": "started",
         "message": "Search task queued. Jobs will appear as they are found.",
-        "params": request.model_dump(),
+        "params": params,
         "search_id": search_id,
         "db_search_id": db_search_id,
     }
@@ -246,11 +426,55 @@ def get_search_status(search_id: str, db: Session = Depends(get_db)):
             "db_search_id": data.get("db_search_id"),
         }
 
-    # Fallback for completed search no longer in memory.
-    raise HTTPException(status_code=404, detail="Search status not found")
+    # Fallback for runs no longer in memory (evicted after finishing, or started before a restart).
+    record = db.execute(
+        select(SearchQuery.id, SearchQuery.run_state, SearchQuery.results_count).where(SearchQuery.run_id == search_id)
+    ).first()
+    if record is None or record.run_state is None:
+        raise HTTPException(status_code=404, detail="Search status not found")
+    return {
+        "search_id": search_id,
+        "state": record.run_state,
+        "saved_jobs": record.results_count or 0,
+        "scored_jobs": 0,
+        "unscored_jobs": 0,
+        "source_breakdown": {},
+        "warnings": [],
+        "db_search_id": record.id,
+    }
+
+
+def _search_slots() -> asyncio.Semaphore:
+    """Per-loop cap on search runs scraping at once (browser sessions are the scarce resource)."""
+    loop = asyncio.get_running_loop()
+    slots = _SEARCH_SLOTS.get(loop)
+    if slots is None:
+        from job_search.config import settings
+
+        slots = _SEARCH_SLOTS[loop] = asyncio.Semaphore(max(1, settings.max_concurrent_searches))
+    return slots
 
 
 async def _run_search_task(params: dict, search_id: str, db_search_id: int | None = None):
+    """Run a search once a slot frees up; until then it stays queued and can be stopped."""
+    slots = _search_slots()
+    try:
+        await slots.acquire()
+    except asyncio.CancelledError:
+        await _finish_search(search_id, "cancelled")
+        raise
+    try:
+        status = active_searches.get(search_id)
+        # Stopped while queued: hand the slot straight back without ever reporting "running".
+        if status is not None and status.get("cancelled"):
+            await _finish_search(search_id, "cancelled")
+            return
+        await _execute_search(params, search_id, db_search_id)
+    finally:
+        slots.release()
+
+
+async def _execute_search(params: dict, search_id: str, db_search_id: int | None = None):
     from job_search.database import SessionLocal
     from job_search.services.scraper import LinkedInScraper, GeneralWebScraper, WebJobScraper
     from job_search.services.job_matcher import JobMatcher
@@ -261,11 +485,11 @@ async def _run_search_task(params: dict, search_id: str, db_search_id: int | Non
         status = active_searches.get(search_id)
         if not status:
             return
-        status["state"] = "running"
-
         if status.get("cancelled"):
-            _mark_completed(search_id, "cancelled")
+            await _finish_search(search_id, "cancelled")
             return
+        status["state"] = "running"
+        await asyncio.to_thread(_persist_run_state, db_search_id, "running")
 
         raw_keywords = params.get("keywords")
         keywords_list = raw_keywords if isinstance(raw_keywords, list) else [raw_keywords]
@@ -289,9 +513,13 @@ async def _run_search_task(params: dict, search_id: str, db_search_id: int | Non
                     "Target roles were inferred from your search keywords for scoring.",
                 )
 
+        # Scrapes take minutes: return the connection held since the profile lookup to the
+        # pool. Each batch below commits right after it is saved, so no transaction stays
+        # open across a scrape; the session checks a connection out again on next use.
+        db.close()
+
         scraper = LinkedInScraper()
         custom_scraper = GeneralWebScraper()
-        web_scraper = WebJobScraper()
         matcher = JobMatcher(llm_client=get_llm_client())
 
         portals_list = params.get("portals") or ["linkedin"]
@@ -300,89 +528,140 @@ async def _run_search_task(params: dict, search_id: str, db_search_id: int | Non
 
         total_jobs_found = 0
         seen_in_run: set[tuple[str, str, str, str]] = set()
+        saved_ext_ids: set[str] = set()
+        # Suffix for external ids already owned by another run (see save_batch).
+        run_scope = str(db_search_id or search_id[:8])
 
-        def upsert_from_job_data(job_data: dict, default_source: str):
+        def save_batch(found_jobs: list[dict], default_source: str):
+            """Score and insert one scraper batch: one lookup for known ids, one multi-row INSERT."""
             nonlocal total_jobs_found
-            if not job_data.get("title"):
-                return
-
-            src = job_data.get("source", default_source)
-            ext_id = str(job_data.get("external_id") or "").strip()
-            original_ext_id = ext_id
-            url = str(job_data.get("url") or "").strip()
-            title_norm = str(job_data.get("title") or "").strip().lower()
-            company_norm = str(job_data.get("company") or "unknown").strip().lower()
-            run_key = (src, ext_id or url, title_norm, company_norm)
-            if run_key in seen_in_run:
-                return
-            seen_in_run.add(run_key)
-
-            if db_search_id and ext_id:
-                existing_in_run = (
-                    db.query(Job)
-                    .filter(
-                        Job.search_query_id == db_search_id,
-                        Job.source == src,
-                        Job.external_id == ext_id,
-                    )
-                    .first()
+            candidates = []
+            for job_data in found_jobs:
+                if not job_data.get("title"):
+                    continue
+                src = job_data.get("source", default_source)
+                ext_id = _clean_text(job_data.get("external_id"))
+                run_key = (
+                    src,
+                    ext_id or _clean_text(job_data.get("url")),
+                    _clean_text(job_data.get("title")).lower(),
+                    _clean_text(job_data.get("company") or "unknown").lower(),
                 )
-                if existing_in_run:
-                    return
-
-            # Preserve historical runs: if external_id already exists globally for another run,
-            # create a run-scoped variant instead of re-linking the old row.
-            if ext_id:
-                existing_global = db.query(Job).filter(Job.external_id == ext_id).first()
-                if existing_global and existing_global.search_query_id != db_search_id:
-                    scope = str(db_search_id or search_id[:8])
-                    ext_id = f"{original_ext_id}::run:{scope}"
+                if run_key in seen_in_run:
+                    continue
+                seen_in_run.add(run_key)
+                candidates.append((job_data, src, ext_id))
+
+            # Ids saved earlier in this run are resolved from memory; only new ones hit the DB.
+            incoming_ids = {ext_id for _, _, ext_id in candidates if ext_id} - saved_ext_ids
+            owner_by_ext_id = (
+                dict(db.execute(select(Job.external_id, Job.search_query_id).where(Job.external_id.in_(incoming_ids))).all())
+                if incoming_ids
+                else {}
+            )
 
+            accepted = []
+            for job_data, src, ext_id in candidates:
+                # Concurrent scrapes each ask for the full remaining quota; keep only what fits.
+                if total_jobs_found + len(accepted) >= limit_per_search:
+                    break
+                if ext_id:
+                    # Already saved by this run (in an earlier batch or earlier in this one).
+                    if ext_id in saved_ext_ids or (db_search_id and owner_by_ext_id.get(ext_id, -1) == db_search_id):
+                        continue
+                    saved_ext_ids.add(ext_id)
+                    # Preserve historical runs: if external_id already exists globally for another run,
+                    # create a run-scoped variant instead of re-linking the old row.
+                    if ext_id in owner_by_ext_id:
+                        ext_id = f"{ext_id}::run:{run_scope}"
+                accepted.append((job_data, src, ext_id))
+
+            match_results = []
+            if can_score and accepted:
+                match_results = matcher.batch_score([job_data for job_data, _, _ in accepted], profile_data)
             if can_score:
-                match_result = matcher.score_job(job_data, profile_data)
-                match_score = match_result.overall_score
-                match_details = {
-                    "skill_score": match_result.skill_score,
-                    "vibe_score": match_result.vibe_score,
-                    "title_score": match_result.title_score,
-                    "explanation": match_result.explanation,
-                    "vibe_explanation": match_result.vibe_explanation,
-                    "matched_skills": match_result.matched_skills,
-                    "missing_skills": match_result.missing_skills,
-                }
-                active_searches[search_id]["scored_jobs"] += 1
+                rows = [
+                    _job_row(job_data, src, ext_id, result.overall_score, _scored_match_details(result), db_search_id)
+                    for (job_data, src, ext_id), result in zip(accepted, match_results)
+                ]
             else:
-                match_score = 50.0
-                match_details = _unscored_match_details("profile_incomplete")
-                active_searches[search_id]["unscored_jobs"] += 1
-
-            active_searches[search_id]["source_breakdown"][src] = active_searches[search_id]["source_breakdown"].get(src, 0) + 1
-
-            job = Job(
-                external_id=ext_id or None,
-                source=src,
-                title=job_data.get("title"),
-                company=job_data.get("company", "Unknown"),
-                location=job_data.get("location", ""),
-                work_type=job_data.get("work_type", "onsite"),
-                is_easy_apply=job_data.get("is_easy_apply", False),
-                apply_url=job_data.get("apply_url"),
-                description=job_data.get("description", ""),
-                description_html=job_data.get("description_html", ""),
-                url=job_data.get("url", ""),
-                match_score=match_score,
-                match_details=match_details,
-                search_query_id=db_search_id,
-            )
-            db.add(job)
-            total_jobs_found += 1
-            active_searches[search_id]["saved_jobs"] = total_jobs_found
+                unscored = _unscored_match_details("profile_incomplete")
+                rows = [_job_row(job_data, src, ext_id, 50.0, unscored, db_search_id) for job_data, src, ext_id in accepted]
+
+            if rows:
+                # A concurrent run may claim an external_id between the lookup above and this
+                # INSERT; the unique index drops that row instead of failing the whole batch.
+                inserted_sources = db.scalars(
+                    upsert_insert(Job, db.get_bind().dialect.name)
+                    .on_conflict_do_nothing(index_elements=["external_id"])
+                    .returning(Job.source),
+                    rows,
+                ).all()
+                total_jobs_found += len(inserted_sources)
+                # Publish the batch's counters in one step rather than per job.
+                status["saved_jobs"] = total_jobs_found
+                status["scored_jobs" if can_score else "unscored_jobs"] += len(inserted_sources)
+                breakdown = status["source_breakdown"]
+                for src, count in Counter(inserted_sources).items():
+                    breakdown[src] = breakdown.get(src, 0) + count
+            # Commit per batch: scrapes still running must not hold a connection or write lock.
+            db.commit()
+
+        save_lock = asyncio.Lock()
+
+        async def save_found_jobs(found_jobs: list[dict], default_source: str):
+            # The session is synchronous: run the lookup, scoring and INSERT in a worker
+            # thread so in-flight scrapes and API requests keep the event loop. The lock
+            # saves batches one at a time, so the session is never used concurrently.
+            async with save_lock:
+                await asyncio.to_thread(save_batch, found_jobs, default_source)
+
+        cancel_event = status.get("cancel_event")
+        if cancel_event is None:
+            cancel_event = status["cancel_event"] = threading.Event()
+        is_cancelled = cancel_event.is_set
+
+        linkedin_filters = {
+            "date_posted": params.get("date_posted"),
+            "work_types": params.get("work_types"),
+            "experience_levels": params.get("experience_levels"),
+            "easy_apply_only": params.get("easy_apply_only"),
+        }
+
+        async def run_scrapes(calls: list, source: str, concurrency: int = _SCRAPE_CONCURRENCY) -> list:
+            """
+            Run independent scraper calls concurrently (bounded, to stay under portal rate
+            limits) and save each batch as it arrives. Calls still waiting for a slot are
+            skipped once the quota is met. Results come back in call order; a failed call
+            yields [] plus a warning.
+            """
+            scrape_slots = asyncio.Semaphore(concurrency)
+
+            async def run_one(call):
+                async with scrape_slots:
+                    if is_cancelled() or total_jobs_found >= limit_per_search:
+                        return []
+                    try:
+                        found_jobs = await call()
+                    except Exception as e:
+                        logger.warning(f"Scrape failed for search {search_id}: {e}")
+                        _register_status_warning(search_id, f"A scraper call failed: {e}")
+                        return []
+                    await save_found_jobs(found_jobs, source)
+                    return found_jobs
+
+            results = await asyncio.gather(*(run_one(call) for call in calls), return_exceptions=True)
+            # Scraper failures are already warnings; anything left (a failed save) fails the run.
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            return results
 
         for portal in portals_list:
             if total_jobs_found >= limit_per_search:
                 break
-            if active_searches.get(search_id, {}).get("cancelled"):
-                _mark_completed(search_id, "cancelled")
+            if is_cancelled():
+                await _finish_search(search_id, "cancelled")
                 return
 
             if portal in ["career_site", "web_url"]:
@@ -391,127 +670,140 @@ async def _run_search_task(params: dict, search_id: str, db_search_id: int | Non
                     _register_status_warning(search_id, f"Portal '{portal}' selected but no custom URLs provided.")
                     continue
 
-                for custom_url in custom_urls:
-                    if total_jobs_found >= limit_per_search:
-                        break
-                    found_jobs = await custom_scraper.scrape_custom_url(
-                        url=custom_url,
-                        keywords=keywords_list,
-                        locations=locations_list,
-                        limit=limit_per_search - total_jobs_found,
-                    )
-                    for job_data in found_jobs:
-                        upsert_from_job_data(job_data, portal)
-                    db.commit()
+                remaining = limit_per_search - total_jobs_found
+                await run_scrapes(
+                    [
+                        partial(
+                            custom_scraper.scrape_custom_url,
+                            url=custom_url,
+                            keywords=keywords_list,
+                            locations=locations_list,
+                            limit=remaining,
+                        )
+                        for custom_url in custom_urls
+                    ],
+                    portal,
+                )
                 continue
 
             if portal == "web":
-                for keyword in keywords_list:
-                    if total_jobs_found >= limit_per_search:
-                        break
-                    location = locations_list[0] if locations_list else ""
-                    found_jobs = await web_scraper.scrape_jobs(
-                        query=keyword,
-                        location=location,
-                        limit=limit_per_search - total_jobs_found,
-                        filters={
-                            "date_posted": params.get("date_posted"),
-                            "work_types": params.get("work_types"),
-                        },
-                    )
-
+                location = locations_list[0] if locations_list else ""
+                remaining = limit_per_search - total_jobs_found
+                # One WebJobScraper per call: it reports warnings through instance attributes.
+                web_scrapers = [WebJobScraper() for _ in keywords_list]
+                batches = await run_scrapes(
+                    [
+                        partial(
+                            web_scraper.scrape_jobs,
+                            query=keyword,
+                            location=location,
+                            limit=remaining,
+                            filters={
+                                "date_posted": params.get("date_posted"),
+                                "work_types": params.get("work_types"),
+                            },
+                        )
+                        for web_scraper, keyword in zip(web_scrapers, keywords_list)
+                    ],
+                    "web",
+                )
+                empty_keywords = []
+                for web_scraper, keyword, found_jobs in zip(web_scrapers, keywords_list, batches):
                     for w in getattr(web_scraper, "_last_warnings", []):
                         _register_status_warning(search_id, w)
+                    if not found_jobs:
+                        empty_keywords.append(keyword)
 
-                    for job_data in found_jobs:
-                        upsert_from_job_data(job_data, "web")
-
-                    if not found_jobs and total_jobs_found < limit_per_search:
+                if empty_keywords and total_jobs_found < limit_per_search:
+                    for keyword in empty_keywords:
                         _register_status_warning(
                             search_id,
                             f"Web sources returned low relevance for '{keyword}'. Trying LinkedIn fallback.",
                         )
-                        fallback_jobs = await scraper.scrape_jobs(
-                            query=keyword,
-                            location=location or "",
-                            limit=limit_per_search - total_jobs_found,
-                            filters={
-                                "date_posted": params.get("date_posted"),
-                                "work_types": params.get("work_types"),
-                                "experience_levels": params.get("experience_levels"),
-                                "easy_apply_only": params.get("easy_apply_only"),
-                            },
-                            check_cancelled=lambda: active_searches.get(search_id, {}).get("cancelled", False),
-                        )
-                        for job_data in fallback_jobs:
-                            upsert_from_job_data(job_data, "linkedin")
-                    db.commit()
+                    remaining = limit_per_search - total_jobs_found
+                    await run_scrapes(
+                        [
+                            partial(
+                                scraper.scrape_jobs,
+                                query=keyword,
+                                location=location or "",
+                                limit=remaining,
+                                filters=linkedin_filters,
+                                check_cancelled=is_cancelled,
+                            )
+                            for keyword in empty_keywords
+                        ],
+                        "linkedin",
+                        concurrency=1,
+                    )
                 continue
 
             if portal not in ("linkedin",):
                 _register_status_warning(search_id, f"Portal '{portal}' is not fully implemented for scraping and was skipped.")
                 continue
 
-            for keyword in keywords_list:
-                for location in locations_list:
-                    if total_jobs_found >= limit_per_search:
-                        break
-                    if active_searches.get(search_id, {}).get("cancelled"):
-                        _mark_completed(search_id, "cancelled")
-                        return
-
-                    found_jobs = await scraper.scrape_jobs(
+            remaining = limit_per_search - total_jobs_found
+            await run_scrapes(
+                [
+                    partial(
+                        scraper.scrape_jobs,
                         query=keyword,
                         location=location or "",
-                        limit=limit_per_search - total_jobs_found,
-                        filters={
-                            "date_posted": params.get("date_posted"),
-                            "work_types": params.get("work_types"),
-                            "experience_levels": params.get("experience_levels"),
-                            "easy_apply_only": params.get("easy_apply_only"),
-                        },
-                        check_cancelled=lambda: active_searches.get(search_id, {}).get("cancelled", False),
+                        limit=remaining,
+                        filters=linkedin_filters,
+                        check_cancelled=is_cancelled,
                     )
+                    for keyword in keywords_list
+                    for location in locations_list
+                ],
+                portal,
+                concurrency=1,
+            )
 
-                    for job_data in found_jobs:
-                        upsert_from_job_data(job_data, portal)
-                    db.commit()
-
-                if total_jobs_found >= limit_per_search:
-                    break
+        if is_cancelled():
+            await _finish_search(search_id, "cancelled")
+            return
 
         if db_search_id:
-            search_record = db.query(SearchQuery).filter(SearchQuery.id == db_search_id).first()
-            if search_record:
-                search_record.results_count = total_jobs_found
+            def record_results_count():
+                db.execute(
+                    update(SearchQuery).where(SearchQuery.id == db_search_id).values(results_count=total_jobs_found)
+                )
                 db.commit()
 
-        _mark_completed(search_id, "completed")
+            await asyncio.to_thread(record_results_count)
 
+        await _finish_search(search_id, "completed")
+
+    except asyncio.CancelledError:
+        await _finish_search(search_id, "cancelled")
+        raise
     except Exception as e:
         logger.exception(f"Search task failed: {e}")
         _register_status_warning(search_id, f"Search failed: {e}")
-        _mark_completed(search_id, "failed")
+        await _finish_search(search_id, "failed")
     finally:
         db.close()
 
 
 @router.get("/active")
-def get_active_search():
-    active = {
-        sid: data
-        for sid, data in active_searches.items()
-        if not data.get("cancelled") and data.get("state") in {"queued", "running"}
-    }
-    if not active:
-        return {"active": False}
-
-    sorted_active = sorted(
-        active.items(),
-        key=lambda x: datetime.fromisoformat(x[1].get("started_at")) if x[1].get("started_at") else datetime.min,
-        reverse=True,
+async def get_active_search():
+    # No I/O here (a lock held for a dict snapshot), so it runs on the loop instead of
+    # taking a threadpool slot on every UI poll.
+    with _searches_lock:
+        searches = list(active_searches.items())
+    latest = max(
+        (
+            (sid, data)
+            for sid, data in searches
+            if not data.get("cancelled") and data.get("state") in {"queued", "running"}
+        ),
+        key=lambda item: item[1].get("started_at_ts", 0.0),
+        default=None,
     )
-    search_id, data = sorted_active[0]
+    if latest is None:
+        return {"active": False}
+    search_id, data = latest
 
     return {
         "active": True,
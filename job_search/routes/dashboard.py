@@ -2,17 +2,18 @@ import logging
 from datetime import datetime, timedelta
 from types import SimpleNamespace
 from typing import Optional
-from sqlalchemy import or_, text
+from sqlalchemy import or_, select, text
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from fastapi import APIRouter, Depends, Request, Query
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import func as sa_func
 
 from job_search.app import templates
 from job_search.database import get_db, init_db
 from job_search.models import Job, Application, ApplicationStatus, Resume, SearchQuery, UserProfile
 from job_search.config import settings
+from job_search.routes.api_applications import cached_stats
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -61,14 +62,18 @@ def index():
 
 @router.get("/dashboard")
 def dashboard(request: Request, db: Session = Depends(get_db)):
-    total_jobs = db.query(Job).filter(Job.is_archived == False).count()
-    total_applied = db.query(Application).filter(
-        Application.status == ApplicationStatus.SUBMITTED
-    ).count()
-    total_interviews = db.query(Application).filter(
-        Application.status == ApplicationStatus.INTERVIEW
-    ).count()
-    total_apps = db.query(Application).count()
+    # Header counts in one round trip: conditional aggregates over applications plus the
+    # active-job count as a scalar subquery. Shares the stats cache (TTL + write invalidation).
+    active_jobs = select(sa_func.count()).select_from(Job).where(Job.is_archived == False).scalar_subquery()
+    header_counts = select(
+        active_jobs,
+        sa_func.count().filter(Application.status == ApplicationStatus.SUBMITTED),
+        sa_func.count().filter(Application.status == ApplicationStatus.INTERVIEW),
+        sa_func.count(),
+    ).select_from(Application)
+    total_jobs, total_applied, total_interviews, total_apps = cached_stats(
+        "dashboard_header", lambda: tuple(db.execute(header_counts).one())
+    )
     success_rate = round((total_interviews / total_apps * 100) if total_apps > 0 else 0, 1)
 
     recent_jobs = (
@@ -80,6 +85,7 @@ def dashboard(request: Request, db: Session = Depends(get_db)):
     )
     recent_apps = (
         db.query(Application)
+        .options(selectinload(Application.job).load_only(Job.id, Job.title, Job.company))
         .order_by(Application.created_at.desc())
         .limit(5)
         .all()
@@ -197,7 +203,7 @@ def jobs_page(
             pass
 
     jobs = _run_with_migration_retry(
-        lambda: query.order_by(Job.match_score.desc().nullslast()).all(),
+        lambda: query.order_by(Job.match_score.desc().nullslast(), Job.id.desc()).all(),
         [],
     )
 
@@ -235,29 +241,21 @@ def jobs_page(
                 )
                 for row in rows
             ]
-        # Keep only the most recent application per job so filters/counters reflect current pipeline state.
-        app_by_job = {}
-        app_rows_sorted = sorted(
-            app_rows,
-            key=lambda a: (
-                getattr(a, "job_id", 0),
-                getattr(a, "status_updated_at", None) or getattr(a, "created_at", None) or datetime.min,
-                getattr(a, "id", 0),
-            ),
-        )
-        for app_row in app_rows_sorted:
-            app_by_job[getattr(app_row, "job_id")] = app_row
+        # applications.job_id is unique, so each job has at most one application row.
+        app_by_job = {getattr(app_row, "job_id"): app_row for app_row in app_rows}
 
     jobs_for_counts = list(jobs)
+    # Normalize each job's pipeline status once; filtering, ordering, grouping and the
+    # counters below all read it from here.
+    status_by_job = {job.id: _status_from_app(app_by_job.get(job.id)) for job in jobs}
 
     if app_status:
         status_l = app_status.lower().strip()
         filtered_jobs = []
         for job in jobs:
-            a = app_by_job.get(job.id)
-            a_status = _status_from_app(a)
+            a_status = status_by_job[job.id]
             if status_l == "unapplied":
-                if not a:
+                if job.id not in app_by_job:
                     filtered_jobs.append(job)
             elif status_l in {"submitted", "queued", "in_progress", "reviewed", "failed", "interview", "rejected", "offer", "withdrawn"}:
                 if a_status == status_l:
@@ -282,14 +280,9 @@ def jobs_page(
         "withdrawn": 9,
         "other": 10,
     }
-    jobs = sorted(
-        jobs,
-        key=lambda j: (
-            status_order.get(_status_from_app(app_by_job.get(j.id)), status_order["other"]),
-            -(j.match_score or 0),
-            -j.id,
-        ),
-    )
+    # The query already orders by score then id; a stable sort on the status rank alone
+    # keeps that order within each status.
+    jobs = sorted(jobs, key=lambda j: status_order.get(status_by_job[j.id], status_order["other"]))
 
     status_labels = {
         "queued": "Queued",
@@ -306,8 +299,7 @@ def jobs_page(
     }
     grouped_jobs_map: dict[str, list[Job]] = {k: [] for k in status_order.keys()}
     for job in jobs:
-        job_status = _status_from_app(app_by_job.get(job.id))
-        grouped_jobs_map.setdefault(job_status, []).append(job)
+        grouped_jobs_map.setdefault(status_by_job[job.id], []).append(job)
     grouped_jobs = [
         {
             "status": status_key,
@@ -328,11 +320,10 @@ def jobs_page(
         "other": 0,
     }
     for job in jobs_for_counts:
-        a = app_by_job.get(job.id)
-        if not a:
+        if job.id not in app_by_job:
             app_status_counts["unapplied"] += 1
             continue
-        s = _status_from_app(a)
+        s = status_by_job[job.id]
         if s in app_status_counts:
             app_status_counts[s] += 1
         else:
@@ -367,7 +358,7 @@ def jobs_page(
 
 @router.get("/jobs/{job_id}")
 def job_detail_page(job_id: int, request: Request, db: Session = Depends(get_db)):
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = db.get(Job, job_id)
     if not job:
         return RedirectResponse(url="/jobs")
     application = db.query(Application).filter(Application.job_id == job_id).first()
@@ -380,8 +371,11 @@ def job_detail_page(job_id: int, request: Request, db: Session = Depends(get_db)
 
 @router.get("/applications")
 def applications_page(request: Request, db: Session = Depends(get_db)):
+    # Jobs arrive in one IN query with just the columns the table shows, instead of a lazy
+    # load per row while rendering.
     apps = (
         db.query(Application)
+        .options(selectinload(Application.job).load_only(Job.id, Job.title, Job.company, Job.match_score))
         .order_by(Application.created_at.desc())
         .all()
     )
@@ -397,9 +391,7 @@ def applications_page(request: Request, db: Session = Depends(get_db)):
         "withdrawn": 0,
         "other": 0,
     }
-    # Eager load jobs for display
     for app in apps:
-        _ = app.job
         status_norm = _normalize_application_status(getattr(app, "status", None))
         setattr(app, "status_normalized", status_norm)
         if status_norm in status_counts:
@@ -28,11 +28,37 @@ class JobResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class JobListItem(BaseModel):
+    """List-view projection of a job; detail fields come from GET /api/jobs/{id}."""
+
+    id: int
+    external_id: str
+    source: str
+    title: str
+    company: str
+    location: Optional[str] = None
+    work_type: Optional[str] = None
+    employment_type: Optional[str] = None
+    experience_level: Optional[str] = None
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    url: str
+    is_easy_apply: bool = False
+    posted_date: Optional[datetime] = None
+    match_score: Optional[float] = None
+    is_archived: bool = False
+    scraped_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
 class JobListResponse(BaseModel):
-    jobs: list[JobResponse]
-    total: int
+    jobs: list[JobListItem]
+    total: Optional[int] = None
     page: int
     per_page: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class JobScoreRequest(BaseModel):
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 import re
 import shutil
+import time
 import urllib.parse
 from datetime import datetime
 from typing import Any, Optional
 
+import orjson
 from playwright.async_api import async_playwright, Page, Frame
+from sqlalchemy import func
+from sqlalchemy.orm import Session
 
 from job_search.config import settings
 from job_search.models import (
@@ -26,6 +29,7 @@ from job_search.models import (
 from job_search.database import SessionLocal
 from job_search.services.apply_url_resolver import resolve_official_apply_url
 from job_search.services import field_resolution, portal_detection
+from job_search.services.learning_summary import build_learning_summary
 from job_search.services.defaults_config import (
     DEFAULT_MOBILE_NUMBER,
     DEFAULT_PHONE_COUNTRY_CODE,
@@ -41,6 +45,58 @@ from job_search.services.defaults_config import (
 
 logger = logging.getLogger(__name__)
 
+_ROLES_CACHE: dict[tuple[int, int], tuple[float, list[str]]] = {}
+_ROLES_CACHE_TTL_SECONDS = 60
+
+
+def collect_fallback_target_roles(db: Session, limit: int = 8) -> list[str]:
+    # A new search query raises the newest id and misses the cache at once; deleted or
+    # edited queries are only picked up when the TTL expires.
+    latest_id = db.query(func.max(SearchQuery.id)).scalar() or 0
+    cache_key = (latest_id, limit)
+    now = time.time()
+    cached = _ROLES_CACHE.get(cache_key)
+    if cached and now - cached[0] < _ROLES_CACHE_TTL_SECONDS:
+        return list(cached[1])
+
+    keyword_rows = (
+        db.query(SearchQuery.keywords).order_by(SearchQuery.id.desc()).limit(limit).all()
+    )
+    roles: list[str] = []
+    seen: set[str] = set()
+    for (raw,) in keyword_rows:
+        candidates: list[str] = []
+        if not raw:
+            continue
+        if isinstance(raw, str):
+            text = raw.strip()
+            if text.startswith("[") and text.endswith("]"):
+                try:
+                    parsed = orjson.loads(text)
+                    if isinstance(parsed, list):
+                        candidates = [str(v) for v in parsed if v]
+                    else:
+                        candidates = [text]
+                except Exception:
+                    candidates = [text]
+            else:
+                candidates = [text]
+        elif isinstance(raw, list):
+            candidates = [str(v) for v in raw if v]
+
+        for item in candidates:
+            role = item.strip()
+            if not role:
+                continue
+            norm = role.lower()
+            if norm in seen:
+                continue
+            seen.add(norm)
+            roles.append(role)
+    _ROLES_CACHE.clear()
+    _ROLES_CACHE[cache_key] = (now, roles)
+    return list(roles)
+
 
 class JobApplier:
     def __init__(self):
@@ -280,6 +336,7 @@ class JobApplier:
 
         root["__learning"] = learning
         user.application_answers = root
+        user.learning_summary_cache = build_learning_summary(learning)
         try:
             db.commit()
             db.refresh(user)
@@ -1496,41 +1553,6 @@ class JobApplier:
                 app.automation_log = (app.automation_log or "") + f"Captured required inputs: {keys}\n"
         db.commit()
 
-    @staticmethod
-    def _collect_fallback_target_roles(db, limit: int = 8) -> list[str]:
-        queries = db.query(SearchQuery).order_by(SearchQuery.id.desc()).limit(limit).all()
-        roles: list[str] = []
-        seen: set[str] = set()
-        for q in queries:
-            raw = q.keywords
-            if not raw:
-                continue
-            candidates: list[str] = []
-            if isinstance(raw, str):
-                text = raw.strip()
-                if text.startswith("[") and text.endswith("]"):
-                    try:
-                        parsed = json.loads(text)
-                        if isinstance(parsed, list):
-                            candidates = [str(v) for v in parsed if v]
-                    except Exception:
-                        candidates = [text]
-                else:
-                    candidates = [text]
-            elif isinstance(raw, list):
-                candidates = [str(v) for v in raw if v]
-
-            for item in candidates:
-                role = item.strip()
-                if not role:
-                    continue
-                key = role.lower()
-                if key in seen:
-                    continue
-                seen.add(key)
-                roles.append(role)
-        return roles
-
     def refresh_job_score_if_stale(
         self,
         job: Optional[Job],
@@ -1554,7 +1576,7 @@ class JobApplier:
 
         from job_search.services.job_matcher import JobMatcher
 
-        fallback_roles = self._collect_fallback_target_roles(db)
+        fallback_roles = collect_fallback_target_roles(db)
         profile_dict = {
             "skills": user.skills or [],
             "experience": user.experience or [],
@@ -1720,7 +1742,8 @@ class JobApplier:
 
             generator = ResumeGenerator()
             try:
-                output_path = generator.generate_pdf(
+                output_path = await asyncio.to_thread(
+                    generator.generate_pdf,
                     tailored_data,
                     output_filename=f"tailored_{resume.id}_job_{job.id}.pdf",
                     require_pdf=True,
@@ -1772,7 +1795,7 @@ class JobApplier:
     ):
         """Main automation entry point with threshold gating and safe mode."""
         db = SessionLocal()
-        app = db.query(Application).filter(Application.id == application_id).first()
+        app = db.get(Application, application_id)
         if not app:
             logger.error(f"Application {application_id} not found")
             db.close()
@@ -1792,7 +1815,7 @@ class JobApplier:
 
         job = app.job
         user = db.query(UserProfile).order_by(UserProfile.id.desc()).first()
-        resume = db.query(Resume).filter(Resume.id == resume_id).first() if resume_id else db.query(Resume).filter(Resume.is_primary == True).first()
+        resume = db.get(Resume, resume_id) if resume_id else db.query(Resume).filter(Resume.is_primary == True).first()
         runtime_answer_overrides: dict[str, Any] = {}
         runtime_value_sources: dict[str, str] = {}
         resume_path: str = ""
@@ -103,8 +103,10 @@ class JobMatcher:
 
     def score_job(self, job: dict, profile: dict) -> MatchResult:
         """Score a job against user profile using keyword matching."""
+        return self._score_with_skills(job, profile, self._build_effective_skills(profile))
+
+    def _score_with_skills(self, job: dict, profile: dict, user_skills: list[str]) -> MatchResult:
         description = job.get("description", "")
-        user_skills = self._build_effective_skills(profile)
         target_roles = profile.get("target_roles", [])
         target_locations = profile.get("target_locations", [])
         user_experience = profile.get("experience", [])
@@ -419,5 +421,6 @@ Return JSON:
         return base_result
 
     def batch_score(self, jobs: list[dict], profile: dict) -> list[MatchResult]:
-        """Score multiple jobs using fast mode."""
-        return [self.score_job(job, profile) for job in jobs]
+        """Score multiple jobs using fast mode, deriving the profile's skill list once."""
+        user_skills = self._build_effective_skills(profile)
+        return [self._score_with_skills(job, profile, user_skills) for job in jobs]
@@ -0,0 +1,83 @@
+"""
+Rendering of the automation-learning summary shown on the profile page.
+
+The raw counters live under UserProfile.application_answers["__learning"] and are
+updated once per automation run. The summary derived from them is computed at that
+write and stored in UserProfile.learning_summary_cache, so reads are a column load.
+"""
+
+from __future__ import annotations
+
+import heapq
+from operator import itemgetter
+from typing import Any, Optional
+
+
+def empty_learning_summary() -> dict:
+    return {
+        "enabled": False,
+        "totals": {"runs": 0, "submitted": 0, "reviewed": 0, "failed": 0},
+        "top_blockers": [],
+        "top_missing_inputs": [],
+        "top_domain_outcomes": [],
+        "top_learned_field_values": {},
+    }
+
+
+def _count(value: Any) -> int:
+    # Counters are ints in practice; `type(...) is int` also keeps bools out.
+    if type(value) is int:
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return 0
+
+
+def _top_items(mapping: dict, limit: int = 8) -> list[dict]:
+    if not isinstance(mapping, dict):
+        return []
+    # nlargest keeps insertion order among ties, matching a stable descending sort.
+    top = heapq.nlargest(limit, ((k, _count(v)) for k, v in mapping.items()), key=itemgetter(1))
+    return [{"key": k, "count": c} for k, c in top]
+
+
+def build_learning_summary(learning: Optional[Any]) -> dict:
+    """Summarize a raw `__learning` mapping; non-dict input yields the disabled summary."""
+    if not isinstance(learning, dict):
+        return empty_learning_summary()
+
+    field_success = learning.get("field_success")
+    top_values = {}
+    if isinstance(field_success, dict):
+        for field_key, value_counts in field_success.items():
+            if not isinstance(value_counts, dict) or not value_counts:
+                continue
+            value, count = max(((v, _count(c)) for v, c in value_counts.items()), key=itemgetter(1))
+            top_values[field_key] = {"value": value, "count": count}
+
+    domain_stats = learning.get("domain_stats")
+    top_domains = []
+    if isinstance(domain_stats, dict):
+        for domain, stats in domain_stats.items():
+            if not isinstance(stats, dict):
+                continue
+            top_domains.append(
+                {
+                    "domain": domain,
+                    "runs": int(stats.get("runs", 0)),
+                    "submitted": int(stats.get("submitted", 0)),
+                    "failed": int(stats.get("failed", 0)),
+                    "reviewed": int(stats.get("reviewed", 0)),
+                }
+            )
+        top_domains.sort(key=lambda item: item["runs"], reverse=True)
+
+    return {
+        "enabled": True,
+        "totals": learning.get("totals") or {"runs": 0, "submitted": 0, "reviewed": 0, "failed": 0},
+        "top_blockers": _top_items(learning.get("blocker_counts") or {}),
+        "top_missing_inputs": _top_items(learning.get("missing_required_inputs") or {}),
+        "top_domain_outcomes": top_domains[:10],
+        "top_learned_field_values": top_values,
+        "updated_at": learning.get("updated_at"),
+    }
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import logging
+import weakref
 from enum import Enum
 from typing import AsyncGenerator, Optional
 
@@ -197,8 +198,25 @@ class LLMClient:
             return json.loads(text)
 
 
+# The async SDK clients pool connections on the event loop that first uses them, so
+# clients are shared per loop (API loop, autonomous worker loop) rather than globally.
+_LOOP_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Optional[LLMClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def get_llm_client() -> Optional[LLMClient]:
-    """Retrieve LLM client based on application settings."""
+    """Retrieve LLM client based on application settings, reused within the running event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _build_llm_client()
+    if loop not in _LOOP_CLIENTS:
+        _LOOP_CLIENTS[loop] = _build_llm_client()
+    return _LOOP_CLIENTS[loop]
+
+
+def _build_llm_client() -> Optional[LLMClient]:
     from job_search.config import settings
 
     provider_str = settings.llm_provider.lower()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import logging
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
@@ -247,7 +249,7 @@ class CoordinatorAgent:
     ):
         db = SessionLocal()
         try:
-            run = db.query(AutonomousRun).filter(AutonomousRun.id == run_id).first()
+            run = db.get(AutonomousRun, run_id)
             if not run:
                 return
 
@@ -257,7 +259,7 @@ class CoordinatorAgent:
             db.commit()
 
             profile = db.query(UserProfile).order_by(UserProfile.id.desc()).first()
-            resume = db.query(Resume).filter(Resume.id == resume_id).first() if resume_id else db.query(Resume).filter(Resume.is_primary == True).first()
+            resume = db.get(Resume, resume_id) if resume_id else db.query(Resume).filter(Resume.is_primary == True).first()
 
             for job_id in job_ids:
                 db.refresh(run)
@@ -266,7 +268,7 @@ class CoordinatorAgent:
                     db.commit()
                     return
 
-                job = db.query(Job).filter(Job.id == job_id).first()
+                job = db.get(Job, job_id)
                 if not job:
                     run.skipped_jobs += 1
                     run.processed_jobs += 1
@@ -373,12 +375,11 @@ class CoordinatorAgent:
                     log_row.status = "running"
                     log_row.message = f"Submission attempt {attempt}"
                     # Clear stale stop flags when a fresh run/attempt is intentionally started.
-                    app_inputs = dict(app.user_inputs or {})
-                    if app_inputs.get("__stop_requested"):
+                    app_inputs = app.user_inputs
+                    if app_inputs and app_inputs.get("__stop_requested"):
                         app_inputs["__stop_requested"] = False
                         app_inputs["__stop_requested_at"] = None
                         app_inputs["__stop_reason"] = None
-                        app.user_inputs = app_inputs
                     db.commit()
                     try:
                         await self.submitter.submit(
@@ -449,7 +450,7 @@ class CoordinatorAgent:
 
         except Exception as e:
             logger.exception(f"Autonomous run failed: {e}")
-            run = db.query(AutonomousRun).filter(AutonomousRun.id == run_id).first()
+            run = db.get(AutonomousRun, run_id)
             if run:
                 run.status = "failed"
                 run.error_message = str(e)
@@ -457,3 +458,59 @@ class CoordinatorAgent:
                 db.commit()
         finally:
             db.close()
+
+
+class AutonomousRunWorker:
+    """
+    Executes CoordinatorAgent runs on a dedicated event-loop thread.
+
+    The coordinator mixes blocking DB calls with long Playwright sessions; running it
+    here keeps that work off the API event loop, so request handling and run
+    execution no longer compete for the same loop.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="autonomous-run-worker", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def submit(
+        self,
+        run_id: int,
+        job_ids: list[int],
+        resume_id: Optional[int],
+        min_score: float,
+        safe_mode: bool,
+        require_confirmation: bool,
+        max_retries: int = 2,
+    ) -> concurrent.futures.Future:
+        coordinator = CoordinatorAgent()
+        future = asyncio.run_coroutine_threadsafe(
+            coordinator.run(
+                run_id,
+                job_ids,
+                resume_id,
+                min_score,
+                safe_mode,
+                require_confirmation,
+                max_retries,
+            ),
+            self._ensure_loop(),
+        )
+        future.add_done_callback(self._log_unhandled)
+        return future
+
+    @staticmethod
+    def _log_unhandled(future: concurrent.futures.Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Autonomous run worker task crashed: {future.exception()}")
+
+
+autonomous_worker = AutonomousRunWorker()
@@ -0,0 +1,23 @@
+import asyncio
+from typing import Coroutine
+
+# Strong references to in-flight tasks: the event loop only keeps weak ones, so an
+# unreferenced task can be garbage-collected mid-run. Finished tasks drop out via the
+# done callback.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def spawn(coro: Coroutine, name: str | None = None) -> asyncio.Task:
+    """Run a coroutine as a tracked background task on the current event loop."""
+    task = asyncio.create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def cancel_background_tasks() -> None:
+    """Cancel every tracked task and wait for their cleanup to finish. Called on shutdown."""
+    tasks = list(_background_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
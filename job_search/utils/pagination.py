@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(sort: str, sort_value: Any, row_id: int) -> str:
+    """Build an opaque keyset cursor from the last row of a page."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort, sort_value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, Any, int]:
+    """Inverse of encode_cursor(). Raises ValueError for malformed cursors."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort, sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return str(sort), sort_value, int(row_id)
+    except Exception as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def after_desc_nulls_last(column, value: Any, id_column, row_id: int):
+    """
+    WHERE clause selecting the rows that follow (value, row_id) under
+    ORDER BY column DESC NULLS LAST, id DESC.
+    """
+    if value is None:
+        return and_(column.is_(None), id_column < row_id)
+    return or_(column < value, and_(column == value, id_column < row_id), column.is_(None))
@@ -28,11 +28,11 @@ def run_test():
     for i in range(10):
         time.sleep(3)
         # Check filtered Count
-        r = requests.get(f"{BASE_URL}/api/jobs?search_id={db_search_id}&per_page=1")
+        r = requests.get(f"{BASE_URL}/api/jobs?search_id={db_search_id}&per_page=1&include_total=1")
         filtered_total = r.json().get("total", 0)
         
         # Check UNFILTERED Count (to replicate bug)
-        r2 = requests.get(f"{BASE_URL}/api/jobs?per_page=1")
+        r2 = requests.get(f"{BASE_URL}/api/jobs?per_page=1&include_total=1")
         total_in_db = r2.json().get("total", 0)
         
         print(f"   [Poll {i}] Filtered (ID {db_search_id}): {filtered_total} jobs. Total DB: {total_in_db} jobs.")
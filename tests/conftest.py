@@ -0,0 +1,47 @@
+from collections import OrderedDict
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+import job_search.database as database
+from job_search.database import Base
+from job_search.routes import api_search
+from job_search.services import llm_client
+
+
+@pytest.fixture
+def db():
+    """A session on a fresh in-memory SQLite database with every table created."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def search_env(tmp_path, monkeypatch):
+    """
+    Isolated state for running api_search's search task: a file-backed SQLite database
+    behind SessionLocal (worker threads share it), no LLM client and empty run registries.
+    Returns the session factory and seed(search_id, **fields), which registers a queued run.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(database, "SessionLocal", session_factory)
+    monkeypatch.setattr(llm_client, "get_llm_client", lambda: None)
+    monkeypatch.setattr(api_search, "active_searches", {})
+    monkeypatch.setattr(api_search, "_finished_searches", OrderedDict())
+
+    def seed(search_id: str = "s1", **fields) -> dict:
+        status = {
+            "state": "queued", "cancelled": False, "saved_jobs": 0, "scored_jobs": 0,
+            "unscored_jobs": 0, "warnings": [], "source_breakdown": {}, **fields,
+        }
+        api_search.active_searches[search_id] = status
+        return status
+
+    yield session_factory, seed
+    engine.dispose()
@@ -44,11 +44,12 @@ class TestProfileAPI:
 @pytest.mark.e2e
 class TestJobsAPI:
     def test_list_jobs_empty(self, api: APIRequestContext):
-        resp = api.get("/api/jobs")
+        resp = api.get("/api/jobs?include_total=1")
         assert resp.status == 200
         data = resp.json()
         assert data["jobs"] == []
         assert data["total"] == 0
+        assert data["has_more"] is False
 
     def test_get_nonexistent_job(self, api: APIRequestContext):
         resp = api.get("/api/jobs/99999")
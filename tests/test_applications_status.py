@@ -1,5 +1,14 @@
-from job_search.models import ApplicationStatus
-from job_search.routes.dashboard import _normalize_application_status
+import pytest
+from fastapi import BackgroundTasks, HTTPException, Response
+from sqlalchemy import event, func, select
+from starlette.requests import Request
+
+from job_search.models import Application, ApplicationStatus, Job
+from job_search.routes import api_applications
+from job_search.routes.api_applications import batch_apply, invalidate_stats_cache, list_applications
+from job_search.routes.dashboard import _normalize_application_status, applications_page, dashboard
+from job_search.schemas.application import BatchApplyRequest
+from job_search.utils.pagination import encode_cursor
 
 
 def test_normalize_application_status_from_enum():
@@ -11,3 +20,101 @@ def test_normalize_application_status_from_raw_strings():
     assert _normalize_application_status("QUEUED") == "queued"
     assert _normalize_application_status("in progress") == "in_progress"
     assert _normalize_application_status("ApplicationStatus.SUBMITTED") == "submitted"
+
+
+def test_batch_apply_creates_only_new_eligible_applications(db):
+    jobs = [
+        Job(external_id=f"b{i}", title="t", company="c", description="d", url="u", match_score=score)
+        for i, score in enumerate([80.0, 10.0, None, 90.0])
+    ]
+    db.add_all(jobs)
+    db.flush()
+    db.add(Application(job_id=jobs[3].id, status=ApplicationStatus.QUEUED))
+    db.commit()
+
+    ids = [j.id for j in jobs]
+    request = BatchApplyRequest(job_ids=[*ids, ids[0], 999999], min_score=50)
+    result = batch_apply(request, BackgroundTasks(), db=db, applier=None)
+
+    assert result["job_ids"] == [ids[0], ids[2]]
+    assert result["skipped"] == 4
+    assert db.scalar(select(func.count()).select_from(Application)) == 3
+
+
+def test_get_stats_serves_cached_counts_until_invalidated(db):
+    job = Job(external_id="s1", title="t", company="c", description="d", url="u")
+    db.add(job)
+    db.flush()
+    db.add(Application(job_id=job.id, status=ApplicationStatus.QUEUED))
+    db.commit()
+
+    api_applications.invalidate_stats_cache()
+    assert api_applications.get_stats(db=db).queued == 1
+
+    db.add(Job(external_id="s2", title="t", company="c", description="d", url="u"))
+    db.flush()
+    db.add(Application(job_id=job.id + 1, status=ApplicationStatus.QUEUED))
+    db.commit()
+    assert api_applications.get_stats(db=db).queued == 1
+
+    api_applications.invalidate_stats_cache()
+    stats = api_applications.get_stats(db=db)
+    assert stats.queued == 2
+    assert stats.total == 2
+    api_applications.invalidate_stats_cache()
+
+
+def test_applications_page_loads_jobs_in_one_extra_query(db):
+    jobs = [Job(external_id=f"a{i}", title=f"Role {i}", company="c", description="d", url="u") for i in range(5)]
+    db.add_all(jobs)
+    db.flush()
+    db.add_all([Application(job_id=job.id, status=ApplicationStatus.QUEUED) for job in jobs])
+    db.commit()
+    db.expunge_all()
+
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    request = Request({"type": "http", "method": "GET", "path": "/applications", "headers": [], "query_string": b""})
+    response = applications_page(request, db=db)
+
+    assert len(statements) == 2
+    assert b"Role 4" in response.body
+
+
+def test_dashboard_header_counts_come_from_one_statement(db):
+    jobs = [Job(external_id=f"d{i}", title="t", company="c", description="d", url="u") for i in range(4)]
+    jobs[3].is_archived = True
+    db.add_all(jobs)
+    db.flush()
+    db.add_all(
+        [
+            Application(job_id=jobs[0].id, status=ApplicationStatus.SUBMITTED),
+            Application(job_id=jobs[1].id, status=ApplicationStatus.INTERVIEW),
+            Application(job_id=jobs[2].id, status=ApplicationStatus.QUEUED),
+        ]
+    )
+    db.commit()
+
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    request = Request({"type": "http", "method": "GET", "path": "/dashboard", "headers": [], "query_string": b""})
+    invalidate_stats_cache()
+    context = dashboard(request, db=db).context
+
+    assert (context["total_jobs"], context["total_applied"], context["total_interviews"]) == (3, 1, 1)
+    assert context["success_rate"] == 33.3
+    assert sum("count(" in sql.lower() for sql in statements) == 1
+
+    # Served from the stats cache until a write invalidates it.
+    dashboard(request, db=db)
+    assert sum("count(" in sql.lower() for sql in statements) == 1
+    invalidate_stats_cache()
+
+
+def test_list_applications_rejects_tampered_and_foreign_cursors(db):
+    tampered = [("created_at", "yesterday"), ("created_at", 7), ("posted_date", None)]
+    for sort, value in tampered:
+        cursor = encode_cursor(sort, value, 5)
+        with pytest.raises(HTTPException) as exc:
+            list_applications(Response(), page=1, per_page=25, cursor=cursor, include_total=False, db=db)
+        assert exc.value.status_code == 400
@@ -1,7 +1,12 @@
+import threading
+
+from fastapi import Request, Response
+
 from job_search.models import Job
-from job_search.services.applier import JobApplier
-from job_search.models import Application
-from job_search.services.workflow_agents import CoordinatorAgent, TrackerAgent
+from job_search.services.applier import JobApplier, _ROLES_CACHE, collect_fallback_target_roles
+from job_search.models import Application, ApplicationStatus, AutonomousJobLog, AutonomousRun, SearchQuery
+from job_search.routes.api_autonomous import get_autonomous_run, stop_autonomous_run
+from job_search.services.workflow_agents import AutonomousRunWorker, CoordinatorAgent, TrackerAgent
 
 
 def _job(source: str, apply_url: str = "", url: str = ""):
@@ -50,3 +55,83 @@ def test_tracker_confirmation_includes_submission_audit():
     app.user_inputs = {"__submission_audit": {"job_title": "Role", "final_submission_confirmed": True}}
     payload = tracker.record_confirmation(app)
     assert payload["submission_audit"]["job_title"] == "Role"
+
+
+def test_autonomous_worker_runs_coordinator_off_the_calling_thread(monkeypatch):
+    seen: dict = {}
+
+    async def fake_run(self, run_id, job_ids, *args):
+        seen["thread"] = threading.current_thread().name
+        seen["args"] = (run_id, job_ids, *args)
+
+    monkeypatch.setattr(CoordinatorAgent, "run", fake_run)
+    worker = AutonomousRunWorker()
+    worker.submit(7, [1, 2], None, 75.0, True, False, 2).result(timeout=5)
+
+    assert seen["thread"] == "autonomous-run-worker"
+    assert seen["args"] == (7, [1, 2], None, 75.0, True, False, 2)
+
+
+def test_fallback_target_roles_refresh_when_new_search_is_recorded(db):
+    _ROLES_CACHE.clear()
+    db.add(SearchQuery(name="a", keywords='["Product Manager", "product manager"]'))
+    db.commit()
+    assert collect_fallback_target_roles(db) == ["Product Manager"]
+
+    db.add(SearchQuery(name="b", keywords="Data Analyst"))
+    db.commit()
+    assert collect_fallback_target_roles(db) == ["Data Analyst", "Product Manager"]
+    _ROLES_CACHE.clear()
+
+
+def test_stop_autonomous_run_flags_only_active_applications_in_one_update(db):
+    jobs = [Job(external_id=f"r{i}", title="t", company="c", description="d", url="u") for i in range(3)]
+    db.add_all(jobs)
+    db.flush()
+    apps = [
+        Application(job_id=jobs[0].id, status=ApplicationStatus.IN_PROGRESS, user_inputs={"notice": 30}),
+        Application(job_id=jobs[1].id, status=ApplicationStatus.QUEUED),
+        Application(job_id=jobs[2].id, status=ApplicationStatus.SUBMITTED),
+    ]
+    run = AutonomousRun(status="running", total_jobs=3)
+    db.add_all([*apps, run])
+    db.flush()
+    db.add_all(
+        [AutonomousJobLog(run_id=run.id, job_id=a.job_id, application_id=a.id, stage="apply") for a in apps]
+    )
+    db.commit()
+
+    assert stop_autonomous_run(run.id, db=db).status == "stopped"
+
+    db.expire_all()
+    assert apps[0].status == ApplicationStatus.REVIEWED
+    assert apps[0].user_inputs["notice"] == 30
+    assert apps[0].user_inputs["__stop_requested"] is True
+    assert apps[1].user_inputs["__stop_reason"] == f"Autonomous run #{run.id} stopped from UI"
+    assert apps[1].automation_log == "Stop requested from autonomous run control.\n"
+    assert apps[2].status == ApplicationStatus.SUBMITTED
+    assert apps[2].user_inputs is None
+
+
+def test_autonomous_run_etag_returns_304_until_progress_changes(db):
+    run = AutonomousRun(status="running", total_jobs=2)
+    db.add(run)
+    db.commit()
+
+    def poll(if_none_match: str = ""):
+        headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+        request = Request({"type": "http", "headers": headers})
+        response = Response()
+        result = get_autonomous_run(run.id, request, response, db=db)
+        return result, response.headers["ETag"]
+
+    first, etag = poll()
+    assert first.status == "running"
+    unchanged, _ = poll(etag)
+    assert isinstance(unchanged, Response) and unchanged.status_code == 304
+
+    run.processed_jobs = 1
+    db.commit()
+    changed, new_etag = poll(etag)
+    assert changed.processed_jobs == 1
+    assert new_etag != etag
@@ -2,7 +2,14 @@ import pytest
 
 from job_search.config import settings
 from job_search.models import Application, UserProfile, Resume
+from job_search.routes import api_profile
+from job_search.routes.api_applications import (
+    _missing_from_normalized,
+    _normalize_required,
+    _sync_profile_from_answers,
+)
 from job_search.services.applier import JobApplier
+from job_search.services.learning_summary import build_learning_summary
 
 
 def test_input_key_detection_for_verification_code():
@@ -167,3 +174,84 @@ async def test_resume_tailoring_disabled_uses_original_resume_file():
         assert "Resume tailoring disabled" in (app.automation_log or "")
     finally:
         settings.resume_tailoring_enabled = original
+
+
+def test_sync_profile_from_answers_converts_typed_fields():
+    profile = UserProfile(full_name="Candidate", email="candidate@example.com")
+    _sync_profile_from_answers(
+        profile,
+        {
+            "expected_ctc_lpa": "42.5",
+            "notice_period_days": "30.0",
+            "can_join_immediately": "1",
+            "willing_to_relocate": "maybe",
+            "current_ctc_lpa": "n/a",
+            "official_email": "official@example.com",
+            "unknown_key": "ignored",
+        },
+    )
+    assert profile.expected_ctc_lpa == 42.5
+    assert profile.notice_period_days == 30
+    assert profile.can_join_immediately is True
+    assert profile.willing_to_relocate is None
+    assert profile.current_ctc_lpa is None
+    assert profile.email == "official@example.com"
+
+
+def test_sync_profile_from_answers_prefers_official_email_in_any_order():
+    for answers in (
+        {"email": "personal@example.com", "official_email": "official@example.com"},
+        {"official_email": "official@example.com", "email": "personal@example.com"},
+    ):
+        profile = UserProfile(full_name="Candidate", email="candidate@example.com")
+        _sync_profile_from_answers(profile, answers)
+        assert profile.email == "official@example.com"
+
+
+def test_normalized_required_inputs_detect_missing_answers():
+    normalized = _normalize_required([{"key": " Notice_Period_Days "}, {"key": "phone"}, {"label": "no key"}])
+    merged = {"notice_period_days": 30, "phone": "   "}
+    assert [key for key, _ in normalized] == ["notice_period_days", "phone", ""]
+    assert [_missing_from_normalized(key, merged) for key, _ in normalized] == [False, True, True]
+
+
+def test_profile_analytics_responses_are_cached_until_profile_write(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        api_profile,
+        "_get_or_create_profile",
+        lambda db: calls.append(db) or UserProfile(full_name="", email="", application_answers={}),
+    )
+    api_profile.invalidate_profile_cache()
+
+    first = api_profile.get_automation_learning(db=None)
+    assert api_profile.get_automation_learning(db=None).body == first.body
+    assert len(calls) == 1
+
+    api_profile.invalidate_profile_cache()
+    api_profile.get_automation_learning(db=None)
+    assert len(calls) == 2
+    api_profile.invalidate_profile_cache()
+
+
+def test_learning_summary_ranks_counts_and_keeps_first_seen_ties():
+    summary = build_learning_summary(
+        {
+            "blocker_counts": {f"b{i}": i % 3 for i in range(20)} | {"odd": "n/a"},
+            "field_success": {"source": {"Referral": 3, "LinkedIn": 7, "Indeed": 7}, "empty": {}},
+        }
+    )
+    assert [item["key"] for item in summary["top_blockers"]] == ["b2", "b5", "b8", "b11", "b14", "b17", "b1", "b4"]
+    assert summary["top_blockers"][0]["count"] == 2
+    assert summary["top_learned_field_values"] == {"source": {"value": "LinkedIn", "count": 7}}
+    assert build_learning_summary(None)["enabled"] is False
+
+
+def test_learning_summary_counts_accept_numeric_strings_only():
+    summary = build_learning_summary({"blocker_counts": {"int": 4, "text": "9", "flag": True, "float": 2.5}})
+    assert summary["top_blockers"] == [
+        {"key": "text", "count": 9},
+        {"key": "int", "count": 4},
+        {"key": "flag", "count": 0},
+        {"key": "float", "count": 0},
+    ]
@@ -0,0 +1,99 @@
+import math
+
+from sqlalchemy import create_engine, inspect, select, text, update
+
+from job_search import database
+from job_search.database import _json_loads, json_merge
+from job_search.models import Application, ApplicationStatus, Job
+from job_search.utils.pagination import after_desc_nulls_last, decode_cursor, encode_cursor
+
+
+def test_json_merge_preserves_existing_keys_and_handles_null(db):
+    job_a = Job(external_id="a", title="Role", company="Acme", description="d", url="u")
+    job_b = Job(external_id="b", title="Role", company="Acme", description="d", url="u")
+    db.add_all([job_a, job_b])
+    db.flush()
+    db.add_all(
+        [
+            Application(job_id=job_a.id, status=ApplicationStatus.IN_PROGRESS, user_inputs={"notice": 30}),
+            Application(job_id=job_b.id, status=ApplicationStatus.IN_PROGRESS, user_inputs=None),
+        ]
+    )
+    db.commit()
+
+    stmt = update(Application).values(
+        user_inputs=json_merge(
+            Application.user_inputs,
+            {"__stop_requested": True, "__stop_reason": None},
+            db.get_bind().dialect.name,
+        )
+    )
+    db.execute(stmt)
+    db.commit()
+
+    rows = db.execute(select(Application.job_id, Application.user_inputs).order_by(Application.job_id)).all()
+    assert rows[0].user_inputs == {"notice": 30, "__stop_requested": True, "__stop_reason": None}
+    assert rows[1].user_inputs == {"__stop_requested": True, "__stop_reason": None}
+
+
+def test_application_user_inputs_tracks_in_place_mutation(db):
+    job = Job(external_id="a", title="Role", company="Acme", description="d", url="u")
+    db.add(job)
+    db.flush()
+    app = Application(job_id=job.id, user_inputs={"notice": 30})
+    db.add(app)
+    db.commit()
+
+    app.user_inputs["__stop_requested"] = True
+    db.commit()
+    db.expire_all()
+
+    assert db.get(Application, app.id).user_inputs == {"notice": 30, "__stop_requested": True}
+
+
+def test_keyset_cursor_walks_jobs_without_gaps_or_duplicates(db):
+    scores = [90.0, 90.0, 75.0, None, 60.0, None, 90.0]
+    for i, score in enumerate(scores):
+        db.add(Job(external_id=f"k{i}", title="t", company="c", description="d", url="u", match_score=score))
+    db.commit()
+
+    base = db.query(Job).order_by(Job.match_score.desc().nullslast(), Job.id.desc())
+    expected = [j.id for j in base.all()]
+    seen: list[int] = []
+    cursor = None
+    while True:
+        query = base
+        if cursor:
+            _, value, last_id = decode_cursor(cursor)
+            query = query.filter(after_desc_nulls_last(Job.match_score, value, Job.id, last_id))
+        page = query.limit(2).all()
+        seen.extend(j.id for j in page)
+        if len(page) < 2:
+            break
+        cursor = encode_cursor("match_score", page[-1].match_score, page[-1].id)
+    assert seen == expected
+
+
+def test_json_loads_falls_back_to_stdlib_for_nan_and_infinity():
+    assert _json_loads('{"score": 1.5}') == {"score": 1.5}
+    loaded = _json_loads('{"score": NaN, "cap": Infinity}')
+    assert math.isnan(loaded["score"]) and loaded["cap"] == math.inf
+
+
+def test_init_db_drops_retired_indexes(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    engine = create_engine(url)
+    database.Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE INDEX ix_applications_active ON applications (id) WHERE status = 'QUEUED'"))
+    engine.dispose()
+
+    monkeypatch.setenv("DATABASE_URL", url)
+    database.reset_engine()
+    try:
+        database.init_db()
+        names = {index["name"] for index in inspect(database._get_engine()).get_indexes("applications")}
+    finally:
+        database.reset_engine()
+    assert "ix_applications_active" not in names
+    assert "ix_applications_id" in names
@@ -1,9 +1,26 @@
 from datetime import datetime, timedelta
 
+import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from starlette.requests import Request
 
 from job_search.app import create_app
-from job_search.routes.dashboard import _search_time_bounds
+from job_search.models import (
+    Application,
+    ApplicationStatus,
+    AutomationIssueEvent,
+    AutonomousJobLog,
+    AutonomousRun,
+    Job,
+    UserProfile,
+)
+from job_search.routes import api_jobs
+from job_search.routes.api_jobs import bulk_delete_jobs, list_jobs
+from job_search.routes.dashboard import _search_time_bounds, jobs_page
+from job_search.schemas.job import JobBulkDeleteRequest
+from job_search.utils.pagination import encode_cursor
 
 
 def test_search_time_bounds_today():
@@ -67,3 +84,111 @@ def test_bulk_delete_endpoint_handles_missing_ids_gracefully():
     payload = resp.json()
     assert payload["deleted"] == 0
     assert payload["deleted_ids"] == []
+
+
+def test_list_jobs_application_status_filters_use_semi_joins(db):
+    jobs = [Job(external_id=f"f{i}", title="t", company="c", description="d", url="u") for i in range(4)]
+    db.add_all(jobs)
+    db.flush()
+    db.add_all(
+        [
+            Application(job_id=jobs[0].id, status=ApplicationStatus.QUEUED),
+            Application(job_id=jobs[1].id, status=ApplicationStatus.SUBMITTED),
+            Application(job_id=jobs[2].id, status=ApplicationStatus.IN_PROGRESS),
+        ]
+    )
+    db.commit()
+
+    def ids(status: str) -> list[int]:
+        result = list_jobs(
+            page=1, per_page=25, min_score=0, work_type=None, is_archived=False, sort="id",
+            search_id=None, application_status=status, cursor=None, include_total=True, db=db,
+        )
+        assert result.total == len(result.jobs)
+        return sorted(job.id for job in result.jobs)
+
+    assert ids("unapplied") == [jobs[3].id]
+    assert ids("active_pipeline") == [jobs[0].id, jobs[2].id]
+    assert ids("submitted") == [jobs[1].id]
+
+
+def test_bulk_delete_jobs_removes_dependents_and_reports_existing_ids(db):
+    keep, drop = (Job(external_id=k, title="t", company="c", description="d", url="u") for k in ("keep", "drop"))
+    db.add_all([keep, drop])
+    db.flush()
+    app = Application(job_id=drop.id, status=ApplicationStatus.FAILED)
+    run = AutonomousRun(status="completed")
+    db.add_all([app, run])
+    db.flush()
+    db.add_all(
+        [
+            AutonomousJobLog(run_id=run.id, job_id=drop.id, application_id=app.id),
+            AutomationIssueEvent(application_id=app.id, event_type="detected", category="captcha", message="m"),
+        ]
+    )
+    db.commit()
+    keep_id, drop_id = keep.id, drop.id
+
+    result = bulk_delete_jobs(JobBulkDeleteRequest(job_ids=[drop_id, 999999]), db=db)
+
+    assert result.deleted_ids == [drop_id]
+    assert db.scalars(select(Job.id)).all() == [keep_id]
+    assert db.scalar(select(func.count()).select_from(Application)) == 0
+    assert db.scalar(select(func.count()).select_from(AutonomousJobLog)) == 0
+    assert db.scalar(select(func.count()).select_from(AutomationIssueEvent)) == 0
+
+
+def test_rescore_all_jobs_updates_every_active_job_across_batches(db, monkeypatch):
+    monkeypatch.setattr(api_jobs, "_RESCORE_BATCH_SIZE", 2)
+    db.add(UserProfile(full_name="A", email="a@example.com", skills=["python"], target_roles=["Engineer"]))
+    db.add_all(
+        [
+            Job(external_id=f"rs{i}", title="Python Engineer", company="c", description="python", url="u",
+                is_archived=(i == 4))
+            for i in range(5)
+        ]
+    )
+    db.commit()
+
+    assert api_jobs.rescore_all_jobs(db=db)["updated"] == 4
+    scored = db.execute(select(Job.is_archived, Job.match_score, Job.match_details)).all()
+    assert all((score is not None) != archived for archived, score, _ in scored)
+    assert all(details["matched_skills"] for archived, _, details in scored if not archived)
+
+
+def test_jobs_page_orders_by_pipeline_status_then_score(db):
+    scores = [90.0, 40.0, 70.0, 70.0, None]
+    jobs = [
+        Job(external_id=f"p{i}", title=f"t{i}", company="c", description="d", url="u", match_score=score)
+        for i, score in enumerate(scores)
+    ]
+    db.add_all(jobs)
+    db.flush()
+    db.add_all(
+        [
+            Application(job_id=jobs[0].id, status=ApplicationStatus.SUBMITTED),
+            Application(job_id=jobs[1].id, status=ApplicationStatus.QUEUED),
+        ]
+    )
+    db.commit()
+
+    request = Request({"type": "http", "method": "GET", "path": "/jobs", "headers": [], "query_string": b""})
+    context = jobs_page(request, show_all=True, db=db).context
+
+    # Queued first, then unapplied by score (ties newest first), then submitted.
+    assert [job.title for job in context["jobs"]] == ["t1", "t3", "t2", "t4", "t0"]
+    groups = {group["status"]: [job.title for job in group["jobs"]] for group in context["grouped_jobs"]}
+    assert groups["unapplied"] == ["t3", "t2", "t4"]
+    assert context["app_status_counts"]["unapplied"] == 3
+    assert context["app_status_counts"]["submitted"] == 1
+
+
+def test_list_jobs_rejects_cursor_with_unparseable_date(db):
+    for value in ("not-a-date", 12):
+        with pytest.raises(HTTPException) as exc:
+            list_jobs(
+                page=1, per_page=25, min_score=0, work_type=None, is_archived=False, sort="posted_date",
+                search_id=None, application_status=None, cursor=encode_cursor("posted_date", value, 3),
+                include_total=False, db=db,
+            )
+        assert exc.value.status_code == 400
@@ -0,0 +1,131 @@
+import orjson
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from job_search.models import Application, ApplicationStatus, AutomationIssueEvent, Job, Resume, UserProfile
+from job_search.routes import api_profile
+from job_search.routes.api_profile import _get_or_create_profile, import_from_resume
+from job_search.schemas.user_profile import UserProfileUpdate
+from job_search.services.applier import JobApplier
+
+
+def test_import_from_resume_updates_existing_profile_or_creates_one(db):
+    resume = Resume(
+        name="r", file_path="p", file_type="pdf",
+        parsed_data={"name": "Ada", "email": "ada@example.com", "skills": ["python"], "phone": ""},
+    )
+    db.add(resume)
+    db.commit()
+
+    created = import_from_resume(resume.id, db=db)
+    profile = db.get(UserProfile, created["profile_id"])
+    assert (profile.full_name, profile.email, profile.skills, profile.phone) == (
+        "Ada", "ada@example.com", ["python"], None,
+    )
+
+    resume.parsed_data = {"name": "Ada L."}
+    db.commit()
+    assert import_from_resume(resume.id, db=db)["profile_id"] == profile.id
+    db.expire_all()
+    assert profile.full_name == "Ada L."
+    assert profile.skills == ["python"]
+    assert db.scalar(select(func.count()).select_from(UserProfile)) == 1
+
+
+def test_learning_run_persists_counters_and_rendered_summary(db):
+    job = Job(title="Engineer", company="Acme", description="d", url="https://acme.test/1", external_id="ls-1")
+    user = UserProfile(full_name="Ada", email="ada@example.com", application_answers={"phone_type": "mobile"})
+    db.add_all([job, user])
+    db.commit()
+    app = Application(job_id=job.id, status=ApplicationStatus.SUBMITTED)
+    db.add(app)
+    db.commit()
+
+    JobApplier()._learn_from_application_run(db, user, app, job, runtime_overrides={"phone_type": "mobile"})
+    db.expire_all()
+
+    assert user.application_answers["__learning"]["totals"]["submitted"] == 1
+    assert user.learning_summary_cache["totals"]["runs"] == 1
+    assert user.learning_summary_cache["top_learned_field_values"]["phone_type"]["value"] == "mobile"
+
+    api_profile.invalidate_profile_cache()
+    assert orjson.loads(api_profile.get_automation_learning(db=db).body) == user.learning_summary_cache
+    api_profile.invalidate_profile_cache()
+
+
+def test_profile_put_with_answers_rebuilds_learning_summary(db):
+    def _profile_update(learning: dict) -> UserProfileUpdate:
+        return UserProfileUpdate(full_name="Ada", email="ada@example.com", application_answers={"__learning": learning})
+
+    learning = {"field_success": {"phone_type": {"mobile": 3}}}
+    api_profile.update_profile(_profile_update(learning), db=db)
+    assert api_profile._get_or_create_profile(db).learning_summary_cache["top_learned_field_values"] == {
+        "phone_type": {"value": "mobile", "count": 3}
+    }
+    api_profile.get_automation_learning(db=db)
+
+    learning = {"field_success": {"phone_type": {"landline": 5}}}
+    api_profile.update_profile(_profile_update(learning), db=db)
+    payload = orjson.loads(api_profile.get_automation_learning(db=db).body)
+    assert payload["top_learned_field_values"] == {"phone_type": {"value": "landline", "count": 5}}
+
+    api_profile.update_profile(UserProfileUpdate(full_name="Ada L", email="ada@example.com"), db=db)
+    assert orjson.loads(api_profile.get_automation_learning(db=db).body) == payload
+    api_profile.invalidate_profile_cache()
+
+
+def test_get_or_create_profile_inserts_singleton_once(db):
+    profile = _get_or_create_profile(db)
+    assert profile.id == 1
+    assert _get_or_create_profile(db) is profile
+    assert _get_or_create_profile(Session(db.get_bind())).id == 1
+    assert db.scalar(select(func.count()).select_from(UserProfile)) == 1
+
+
+def test_get_or_create_profile_keeps_legacy_rows(db):
+    db.add(UserProfile(id=5, full_name="Ada", email="ada@example.com"))
+    db.commit()
+    assert _get_or_create_profile(db).full_name == "Ada"
+    assert db.scalar(select(func.count()).select_from(UserProfile)) == 1
+
+
+def test_application_questions_dedupes_issue_and_profile_prompts(db):
+    db.add_all(
+        [
+            AutomationIssueEvent(event_type="detected", category="otp", message="old", suggested_questions=["Code?"]),
+            AutomationIssueEvent(event_type="resolved", category="otp", message="done", suggested_questions=["Skip?"]),
+            AutomationIssueEvent(
+                event_type="detected", category="otp", domain="acme.test", message="new", suggested_questions=["Code?"]
+            ),
+        ]
+    )
+    db.commit()
+
+    api_profile.invalidate_profile_cache()
+    payload = orjson.loads(api_profile.application_questions(limit=50, db=db).body)
+    api_profile.invalidate_profile_cache()
+
+    issue_questions = [q for q in payload["questions"] if q["category"] == "otp"]
+    assert issue_questions == [
+        {"question": "Code?", "category": "otp", "source": None, "domain": "acme.test", "reason": "new"}
+    ]
+    assert payload["count"] == 1 + 7
+
+
+def test_application_questions_treats_false_and_zero_as_answered(db):
+    db.add(
+        UserProfile(
+            id=1, full_name="Ada", email="ada@example.com",
+            requires_sponsorship=False, notice_period_days=0, work_authorization="",
+        )
+    )
+    db.commit()
+
+    api_profile.invalidate_profile_cache()
+    response = api_profile.application_questions(limit=10, db=db)
+    reasons = {q["reason"] for q in orjson.loads(response.body)["questions"]}
+    api_profile.invalidate_profile_cache()
+
+    assert "Missing profile field: work_authorization" in reasons
+    assert "Missing profile field: requires_sponsorship" not in reasons
+    assert "Missing profile field: notice_period_days" not in reasons
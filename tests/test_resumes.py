@@ -0,0 +1,97 @@
+import asyncio
+import hashlib
+import io
+from types import SimpleNamespace
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import func, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from job_search.models import Job, Resume, ResumeVersion
+from job_search.routes import api_resumes
+
+
+def test_resume_read_routes_do_not_lazy_load(db):
+    job = Job(title="Engineer", company="Acme", description="d", url="https://acme.test/r")
+    resume = Resume(name="CV", file_path="cv.pdf", file_type="pdf", raw_text="text")
+    db.add_all([job, resume])
+    db.flush()
+    db.add(ResumeVersion(base_resume_id=resume.id, job_id=job.id, file_path="v.pdf"))
+    db.commit()
+    resume_id = resume.id
+    db.expunge_all()
+
+    listed = api_resumes.list_resumes(db=db)
+    assert [r.name for r in listed] == ["CV"]
+    with pytest.raises(InvalidRequestError):
+        listed[0].versions
+    with pytest.raises(InvalidRequestError):
+        api_resumes.get_resume(resume_id, db=db).raw_text
+
+    versions = api_resumes.list_resume_versions(resume_id, db=db)
+    with pytest.raises(InvalidRequestError):
+        versions[0].job
+
+
+def test_upload_resume_hashes_content_and_reuses_duplicate_uploads(db, tmp_path, monkeypatch):
+    parsed_files = []
+
+    class FakeParser:
+        def __init__(self, llm_client=None):
+            pass
+
+        async def parse(self, path):
+            parsed_files.append(path)
+            return SimpleNamespace(file_type="pdf", structured_data={"name": "Ada"}, raw_text="Ada")
+
+    monkeypatch.setattr(api_resumes, "UPLOAD_DIR", tmp_path)
+    monkeypatch.setattr(api_resumes, "ResumeParser", FakeParser)
+    monkeypatch.setattr(api_resumes, "get_llm_client", lambda: None)
+    content = b"%PDF" + b"x" * (api_resumes._UPLOAD_CHUNK_BYTES + 10)
+
+    def upload(filename):
+        upload_file = UploadFile(io.BytesIO(content), filename=filename)
+        return asyncio.run(api_resumes.upload_resume(file=upload_file, name="CV", db=db))
+
+    first = upload("cv.pdf")
+    second = upload("copy.pdf")
+    content += b"v2"
+    third = upload("cv-v2.pdf")
+
+    assert second.id == first.id
+    assert (first.is_primary, third.is_primary) == (True, False)
+    assert len(parsed_files) == 2
+    assert (tmp_path / "cv-v2.pdf").read_bytes() == content
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cv-v2.pdf", "cv.pdf"]
+
+
+def test_upload_resume_returns_winner_when_identical_upload_commits_first(db, tmp_path, monkeypatch):
+    content = b"%PDF-race"
+
+    class RacingParser:
+        def __init__(self, llm_client=None):
+            pass
+
+        async def parse(self, path):
+            with Session(db.get_bind()) as other:
+                other.add(
+                    Resume(
+                        name="first", file_path=str(tmp_path / "first.pdf"), file_type="pdf",
+                        content_hash=hashlib.sha256(content).hexdigest(),
+                    )
+                )
+                other.commit()
+            return SimpleNamespace(file_type="pdf", structured_data={}, raw_text="")
+
+    monkeypatch.setattr(api_resumes, "UPLOAD_DIR", tmp_path)
+    monkeypatch.setattr(api_resumes, "ResumeParser", RacingParser)
+    monkeypatch.setattr(api_resumes, "get_llm_client", lambda: None)
+
+    upload_file = UploadFile(io.BytesIO(content), filename="second.pdf")
+    result = asyncio.run(api_resumes.upload_resume(file=upload_file, name="second", db=db))
+
+    assert result.name == "first"
+    assert db.scalar(select(func.count()).select_from(Resume)) == 1
+    assert not (tmp_path / "second.pdf").exists()
@@ -1,5 +1,26 @@
-from job_search.routes.api_search import _unscored_match_details, _profile_can_score
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+
+import pytest
+from sqlalchemy import func, select
+
+from job_search.config import settings
+from job_search.models import Job, SearchQuery
+from job_search.routes import api_search
+from job_search.routes.api_search import (
+    _infer_roles_from_keywords,
+    _profile_can_score,
+    _profile_to_dict,
+    _unscored_match_details,
+    create_query,
+    list_queries,
+)
 from job_search.models.user_profile import UserProfile
+from job_search.schemas.search import SearchQueryCreate, SearchQueryResponse
+from job_search.services import job_matcher, scraper
+from job_search.utils import background
 
 
 def test_unscored_match_details_payload():
@@ -29,3 +50,349 @@ def test_profile_can_score_false_when_profile_empty():
     profile.experience = []
     profile.summary = ""
     assert _profile_can_score(profile) is False
+
+
+def test_profile_to_dict_fills_empty_defaults_with_fresh_lists():
+    profile = UserProfile(full_name="User", email="u@example.com")
+    profile.skills = ["Python"]
+    profile.summary = None
+    data = _profile_to_dict(profile)
+    assert data["skills"] == ["Python"]
+    assert data["summary"] == "" and data["target_roles"] == []
+    assert data["frontier_tech_interest"] is None
+
+    blank_a, blank_b = _profile_to_dict(None), _profile_to_dict(None)
+    assert blank_a == {**data, "skills": []}
+    blank_a["skills"].append("leak")
+    assert blank_b["skills"] == []
+
+
+def test_infer_roles_dedupes_case_insensitively_keeping_first_spelling():
+    roles = _infer_roles_from_keywords(["ML Engineer", " ml engineer ", "", None, "Data Scientist", "ML ENGINEER"])
+    assert roles == ["ML Engineer", "Data Scientist"]
+    assert _infer_roles_from_keywords("  Backend  ") == ["Backend"]
+    assert _infer_roles_from_keywords(None) == []
+
+
+def test_finished_searches_are_evicted_after_grace_window_but_running_ones_stay(monkeypatch):
+    monkeypatch.setattr(api_search, "active_searches", {})
+    monkeypatch.setattr(api_search, "_finished_searches", OrderedDict())
+    monkeypatch.setattr(api_search, "_MAX_FINISHED_SEARCHES", 2)
+    for sid in ("running", "a", "b", "c"):
+        api_search.active_searches[sid] = {"state": "running", "cancelled": False}
+    for sid in ("a", "b", "c"):
+        api_search._mark_completed(sid, "completed")
+
+    assert set(api_search.active_searches) == {"running", "b", "c"}
+    assert api_search.active_searches["c"]["state"] == "completed"
+
+    with api_search._searches_lock:
+        api_search._prune_finished_searches(now=time.monotonic() + api_search._FINISHED_SEARCH_TTL_SECONDS)
+    assert set(api_search.active_searches) == {"running"}
+
+
+def test_spawned_tasks_are_tracked_and_cancelled_on_shutdown():
+    async def scenario():
+        task = background.spawn(asyncio.sleep(3600))
+        await asyncio.sleep(0)
+        assert task in background._background_tasks
+        await background.cancel_background_tasks()
+        assert task.cancelled()
+        assert task not in background._background_tasks
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_search_task_records_cancelled_state(monkeypatch):
+    def cancelled(db):
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(api_search, "active_searches", {"s1": {"state": "queued", "cancelled": False}})
+    monkeypatch.setattr(api_search, "_finished_searches", OrderedDict())
+    monkeypatch.setattr(api_search, "_ensure_profile", cancelled)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(api_search._run_search_task({"keywords": ["python"]}, "s1"))
+    assert api_search.active_searches["s1"]["state"] == "cancelled"
+
+
+def test_search_task_inserts_batches_and_scopes_ids_owned_by_other_runs(search_env, monkeypatch):
+    Session, seed = search_env
+    with Session() as db:
+        old_run = SearchQuery(name="old", keywords="python", run_id="s0", run_state="running")
+        new_run = SearchQuery(name="new", keywords="python", run_id="s1", run_state="queued")
+        db.add_all([old_run, new_run])
+        db.flush()
+        db.add(Job(external_id="li-1", title="Old", company="Acme", description="", url="u", search_query_id=old_run.id))
+        db.commit()
+        new_run_id = new_run.id
+
+    batches = [
+        [
+            {"external_id": "li-1", "title": "Engineer", "company": "Acme", "url": "u1"},
+            {"external_id": "li-2", "title": "Engineer II", "company": "Beta", "url": "u2"},
+            {"external_id": "li-2", "title": "Engineer II (dup)", "company": "Beta", "url": "u2"},
+            {"title": "", "company": "Skipped"},
+        ],
+        [{"external_id": "li-2", "title": "Engineer II again", "company": "Beta", "url": "u2"}],
+    ]
+
+    checked_out_during_scrapes = []
+    pool = Session.kw["bind"].pool
+
+    class FakeLinkedIn:
+        async def scrape_jobs(self, **kwargs):
+            checked_out_during_scrapes.append(pool.checkedout())
+            return batches.pop(0) if batches else []
+
+    monkeypatch.setattr(scraper, "LinkedInScraper", FakeLinkedIn)
+    seed(db_search_id=new_run_id)
+
+    params = {"keywords": ["python"], "locations": ["a", "b"], "portals": ["linkedin"], "limit": 10}
+    asyncio.run(api_search._run_search_task(params, "s1", new_run_id))
+
+    with Session() as db:
+        saved = db.execute(
+            select(Job.external_id, Job.title).where(Job.search_query_id == new_run_id).order_by(Job.id)
+        ).all()
+        results_count = db.get(SearchQuery, new_run_id).results_count
+    assert saved == [(f"li-1::run:{new_run_id}", "Engineer"), ("li-2", "Engineer II")]
+    assert api_search.active_searches["s1"]["state"] == "completed"
+    assert api_search.active_searches["s1"]["saved_jobs"] == results_count == 2
+    assert api_search.active_searches["s1"]["unscored_jobs"] == 2
+    assert api_search.active_searches["s1"]["source_breakdown"] == {"linkedin": 2}
+    assert checked_out_during_scrapes == [0, 0]
+
+    # Once evicted from memory (or after a restart) the status comes from the search_queries row.
+    api_search.active_searches.clear()
+    assert api_search.mark_interrupted_searches() == 1
+    with Session() as db:
+        status = api_search.get_search_status("s1", db=db)
+        assert (status["state"], status["saved_jobs"]) == ("completed", 2)
+        assert api_search.get_search_status("s0", db=db)["state"] == "interrupted"
+
+
+def test_get_active_search_returns_latest_running_search(monkeypatch):
+    monkeypatch.setattr(
+        api_search,
+        "active_searches",
+        {
+            "old": {"state": "running", "started_at_ts": 100.0, "params": {"keywords": "a"}},
+            "new": {"state": "queued", "started_at_ts": 300.0, "params": {"keywords": "b", "limit": 7}},
+            "stopped": {"state": "running", "cancelled": True, "started_at_ts": 400.0},
+            "done": {"state": "completed", "started_at_ts": 500.0},
+        },
+    )
+    active = asyncio.run(api_search.get_active_search())
+    assert (active["search_id"], active["keywords"], active["limit"]) == ("new", "b", 7)
+
+    monkeypatch.setattr(api_search, "active_searches", {})
+    assert asyncio.run(api_search.get_active_search()) == {"active": False}
+
+
+def test_search_task_serializes_linkedin_calls_and_skips_them_once_the_quota_is_met(search_env, monkeypatch):
+    Session, seed = search_env
+    in_flight = peak = 0
+    calls = []
+
+    class SlowLinkedIn:
+        async def scrape_jobs(self, query, location, limit, **kwargs):
+            nonlocal in_flight, peak
+            calls.append((query, location))
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if query == "broken":
+                raise RuntimeError("blocked")
+            return [
+                {"external_id": f"{query}-{location}-{i}", "title": f"{query} {i}", "company": location, "url": "u"}
+                for i in range(limit)
+            ]
+
+    monkeypatch.setattr(scraper, "LinkedInScraper", SlowLinkedIn)
+    monkeypatch.setattr(api_search, "_SCRAPE_CONCURRENCY", 3)
+    monkeypatch.setattr(api_search, "_profile_can_score", lambda profile: True)
+    status = seed()
+
+    params = {"keywords": ["broken", "python", "go"], "locations": ["a", "b"], "portals": ["linkedin"], "limit": 5}
+    asyncio.run(api_search._run_search_task(params, "s1"))
+
+    assert peak == 1
+    assert calls == [("broken", "a"), ("broken", "b"), ("python", "a")]
+    assert status["state"] == "completed"
+    assert status["saved_jobs"] == status["scored_jobs"] == 5
+    assert any("blocked" in w for w in status["warnings"])
+    with Session() as db:
+        assert db.scalar(select(func.count()).select_from(Job)) == 5
+
+
+def test_search_task_runs_custom_url_scrapes_concurrently_and_caps_saved_jobs(search_env, monkeypatch):
+    Session, seed = search_env
+    in_flight = peak = 0
+
+    class SlowCareerSite:
+        async def scrape_custom_url(self, url, keywords, locations, limit):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [{"external_id": f"{url}-{i}", "title": f"{url} {i}", "company": "c", "url": url} for i in range(limit)]
+
+    monkeypatch.setattr(scraper, "GeneralWebScraper", SlowCareerSite)
+    monkeypatch.setattr(api_search, "_SCRAPE_CONCURRENCY", 3)
+    status = seed()
+
+    params = {
+        "keywords": ["python"], "portals": ["career_site"], "limit": 5,
+        "custom_portal_urls": [f"https://careers.test/{i}" for i in range(4)],
+    }
+    asyncio.run(api_search._run_search_task(params, "s1"))
+
+    assert peak == 3
+    assert status["state"] == "completed"
+    assert status["saved_jobs"] == status["unscored_jobs"] == 5
+    with Session() as db:
+        assert db.scalar(select(func.count()).select_from(Job)) == 5
+
+
+def test_search_task_skips_external_ids_claimed_by_a_concurrent_run(search_env, monkeypatch):
+    Session, seed = search_env
+
+    class FakeLinkedIn:
+        async def scrape_jobs(self, **kwargs):
+            return [
+                {"external_id": "li-1", "title": "Engineer", "company": "A", "url": "u1"},
+                {"external_id": "li-2", "title": "Engineer II", "company": "B", "url": "u2"},
+            ]
+
+    real_batch_score = job_matcher.JobMatcher.batch_score
+
+    def batch_score_while_another_run_saves(self, jobs, profile):
+        # Lands after the owner lookup and before the INSERT, like a parallel search would.
+        with Session() as other:
+            other.add(Job(external_id="li-2", title="Taken", company="B", description="", url="u", search_query_id=99))
+            other.commit()
+        return real_batch_score(self, jobs, profile)
+
+    monkeypatch.setattr(scraper, "LinkedInScraper", FakeLinkedIn)
+    monkeypatch.setattr(job_matcher.JobMatcher, "batch_score", batch_score_while_another_run_saves)
+    monkeypatch.setattr(api_search, "_profile_can_score", lambda profile: True)
+    status = seed()
+
+    params = {"keywords": ["python"], "locations": ["a"], "portals": ["linkedin"], "limit": 5}
+    asyncio.run(api_search._run_search_task(params, "s1"))
+
+    assert status["state"] == "completed"
+    assert status["saved_jobs"] == status["scored_jobs"] == 1
+    assert status["source_breakdown"] == {"linkedin": 1}
+    with Session() as db:
+        owners = dict(db.execute(select(Job.external_id, Job.search_query_id)).all())
+    assert owners == {"li-1": None, "li-2": 99}
+
+
+def test_stop_search_sets_the_event_scrapers_poll(search_env, monkeypatch):
+    _, seed = search_env
+    polled = []
+
+    class StoppedMidScrape:
+        async def scrape_jobs(self, query, location, limit, check_cancelled, **kwargs):
+            await api_search.stop_search("s1")
+            polled.append(check_cancelled())
+            return []
+
+    monkeypatch.setattr(scraper, "LinkedInScraper", StoppedMidScrape)
+    monkeypatch.setattr(api_search, "_SCRAPE_CONCURRENCY", 1)
+    status = seed(cancel_event=threading.Event())
+
+    params = {"keywords": ["a", "b", "c"], "portals": ["linkedin"], "limit": 5}
+    asyncio.run(api_search._run_search_task(params, "s1"))
+
+    assert polled == [True]
+    assert status["state"] == "cancelled"
+
+
+def test_search_runs_beyond_the_slot_limit_wait_queued(search_env, monkeypatch):
+    _, seed = search_env
+    running = []
+
+    class SlowLinkedIn:
+        async def scrape_jobs(self, query, **kwargs):
+            running.append(query)
+            await asyncio.sleep(0.01)
+            return []
+
+    monkeypatch.setattr(scraper, "LinkedInScraper", SlowLinkedIn)
+    monkeypatch.setattr(settings, "max_concurrent_searches", 1)
+    for sid in ("s1", "s2", "s3"):
+        seed(sid)
+
+    async def main():
+        tasks = [
+            asyncio.create_task(api_search._run_search_task({"keywords": [sid], "portals": ["linkedin"]}, sid))
+            for sid in ("s1", "s2", "s3")
+        ]
+        await asyncio.sleep(0)
+        assert [api_search.active_searches[sid]["state"] for sid in ("s1", "s2", "s3")] == [
+            "running", "queued", "queued"
+        ]
+        await api_search.stop_search("s3")
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+
+    assert running == ["s1", "s2"]
+    assert [api_search.active_searches[sid]["state"] for sid in ("s1", "s2", "s3")] == [
+        "completed", "completed", "cancelled"
+    ]
+
+
+def test_search_stopped_while_queued_never_reports_running(search_env, monkeypatch):
+    _, seed = search_env
+    persisted = []
+
+    class SlowLinkedIn:
+        async def scrape_jobs(self, query, **kwargs):
+            await asyncio.sleep(0.01)
+            return []
+
+    monkeypatch.setattr(scraper, "LinkedInScraper", SlowLinkedIn)
+    monkeypatch.setattr(settings, "max_concurrent_searches", 1)
+    monkeypatch.setattr(api_search, "_persist_run_state", lambda *args: persisted.append(args))
+    for db_search_id, sid in enumerate(("s1", "s2"), start=1):
+        seed(sid, db_search_id=db_search_id)
+
+    async def main():
+        tasks = [
+            asyncio.create_task(
+                api_search._run_search_task({"keywords": [sid], "portals": ["linkedin"]}, sid, db_search_id)
+            )
+            for db_search_id, sid in enumerate(("s1", "s2"), start=1)
+        ]
+        await asyncio.sleep(0)
+        await api_search.stop_search("s2")
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+
+    assert [state for db_search_id, state in persisted if db_search_id == 2] == ["cancelled"]
+    assert api_search.active_searches["s2"]["state"] == "cancelled"
+
+
+def test_list_queries_pages_newest_first_with_response_columns_only(db):
+    db.add_all([SearchQuery(name=f"q{i}", keywords="k", results_count=i, run_id=f"r{i}") for i in range(3)])
+    db.commit()
+    db.expunge_all()
+
+    page = list_queries(limit=2, offset=0, db=db)
+    assert [q.name for q in page] == ["q2", "q1"]
+    assert [SearchQueryResponse.model_validate(q).results_count for q in page] == [2, 1]
+    assert [q.name for q in list_queries(limit=100, offset=2, db=db)] == ["q0"]
+    assert "run_id" not in page[0].__dict__
+
+
+def test_create_query_returns_generated_columns_from_the_insert(db):
+    created = create_query(SearchQueryCreate(name="Backend", keywords="python"), db=db)
+    assert created.id and created.is_active and created.results_count == 0
+    assert db.get(SearchQuery, created.id).name == "Backend"
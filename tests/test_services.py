@@ -1,5 +1,9 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from job_search.config import settings
+from job_search.services.llm_client import get_llm_client
 from job_search.services.resume_parser import ResumeParser
 from job_search.services.resume_tailor import ResumeTailor
 from job_search.services.job_matcher import JobMatcher
@@ -92,3 +96,31 @@ async def test_resume_tailor_llm(mock_llm_client):
     assert result.modified_sections["summary"] == "Experienced Python dev targeting Tech Corp."
     assert "AWS" in result.modified_sections["skills"]
     assert mock_llm_client.complete_json.called
+
+
+def test_get_llm_client_is_shared_within_an_event_loop(monkeypatch):
+    monkeypatch.setattr(settings, "llm_provider", "ollama")
+
+    async def two_lookups():
+        return get_llm_client(), get_llm_client()
+
+    first, second = asyncio.run(two_lookups())
+    assert first is second
+    other_loop, _ = asyncio.run(two_lookups())
+    assert other_loop is not first
+
+
+def test_batch_score_matches_single_scores_and_builds_skills_once(monkeypatch):
+    matcher = JobMatcher()
+    profile = {"skills": ["Python", "FastAPI"], "target_roles": ["Backend Engineer"], "summary": "APIs and data"}
+    jobs = [
+        {"title": "Backend Engineer", "description": "Python FastAPI services", "location": "Remote"},
+        {"title": "Designer", "description": "Figma and branding", "location": "Paris"},
+    ]
+    expected = [matcher.score_job(job, profile) for job in jobs]
+
+    calls = []
+    build = matcher._build_effective_skills
+    monkeypatch.setattr(matcher, "_build_effective_skills", lambda p: calls.append(p) or build(p))
+    assert matcher.batch_score(jobs, profile) == expected
+    assert len(calls) == 1